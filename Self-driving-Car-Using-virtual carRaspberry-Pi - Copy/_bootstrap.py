@@ -0,0 +1,26 @@
+"""Shared ``sys.path`` bootstrap for the legacy entry-point scripts.
+
+Each backward compatible script used to carry its own copy of this logic and
+re-resolved the project paths on every launch.  Keeping it here means the
+resolution happens once per process, and the guard below skips all filesystem
+work when the package is already importable.
+"""
+
+from pathlib import Path
+import sys
+
+_PROJECT_ROOT = Path(__file__).resolve().parent
+_SRC_DIR = _PROJECT_ROOT / "src"
+
+
+def ensure_src_on_path() -> None:
+    """Add the repository's ``src`` directory to ``sys.path`` if needed."""
+
+    if "autonomous_drive" in sys.modules:
+        return
+
+    for path in (_PROJECT_ROOT, _SRC_DIR):
+        if path.exists():
+            str_path = str(path)
+            if str_path not in sys.path:
+                sys.path.insert(0, str_path)
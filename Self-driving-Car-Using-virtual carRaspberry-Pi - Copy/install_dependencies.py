@@ -7,52 +7,82 @@ prepare the Python environment for running the project modules.
 from __future__ import annotations
 
 import argparse
+import importlib.metadata
 import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
-import pkg_resources
+from packaging.requirements import Requirement
 
 
-def parse_requirements(requirements_path: Path) -> List[pkg_resources.Requirement]:
+def parse_requirements(requirements_path: Path) -> List[Requirement]:
     """Parse requirement specifications from the provided file."""
-    requirements: List[pkg_resources.Requirement] = []
+    requirements: List[Requirement] = []
     with requirements_path.open("r", encoding="utf-8") as req_file:
         for line in req_file:
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
-            requirements.append(pkg_resources.Requirement.parse(line))
+            requirements.append(Requirement(line))
     return requirements
 
 
-def is_requirement_satisfied(requirement: pkg_resources.Requirement) -> bool:
-    """Return ``True`` if the requirement is already satisfied."""
-    try:
-        dist = pkg_resources.get_distribution(requirement.project_name)
-    except pkg_resources.DistributionNotFound:
-        return False
+def installed_distributions() -> Dict[str, str]:
+    """Return a ``name -> version`` snapshot of the installed distributions.
+
+    Enumerating ``importlib.metadata.distributions()`` once turns every
+    subsequent requirement check into a dict lookup instead of a fresh
+    ``sys.path`` metadata scan per requirement.
+    """
+    installed: Dict[str, str] = {}
+    for distribution in importlib.metadata.distributions():
+        name = distribution.metadata["Name"]
+        if name:
+            installed[name.lower()] = distribution.version
+    return installed
 
-    return dist in requirement
 
+def is_requirement_satisfied(requirement: Requirement, installed: Dict[str, str]) -> bool:
+    """Return ``True`` if the requirement is already satisfied."""
+    version = installed.get(requirement.name.lower())
+    if version is None:
+        return False
 
-def install_requirement(requirement: pkg_resources.Requirement) -> None:
-    """Install a requirement using pip."""
-    cmd = [sys.executable, "-m", "pip", "install", str(requirement)]
+    return requirement.specifier.contains(version, prereleases=True)
+
+
+def install_requirements(requirements: List[str]) -> None:
+    """Install a batch of requirements with a single pip invocation.
+
+    One subprocess lets pip's resolver and wheel cache share work across
+    packages instead of paying the start-up cost per requirement;
+    ``--prefer-binary`` favours prebuilt wheels over source builds.
+    """
+    cmd = [
+        sys.executable,
+        "-m",
+        "pip",
+        "install",
+        "--prefer-binary",
+        "--no-input",
+        *requirements,
+    ]
     subprocess.check_call(cmd)
 
 
-def ensure_requirements(requirements: Iterable[pkg_resources.Requirement]) -> List[str]:
+def ensure_requirements(requirements: Iterable[Requirement]) -> List[str]:
     """Install missing requirements and return a list of the ones installed."""
-    installed: List[str] = []
-    for requirement in requirements:
-        if is_requirement_satisfied(requirement):
-            continue
-        install_requirement(requirement)
-        installed.append(str(requirement))
-    return installed
+    installed_snapshot = installed_distributions()
+    missing = [
+        str(requirement)
+        for requirement in requirements
+        if not is_requirement_satisfied(requirement, installed_snapshot)
+    ]
+    if missing:
+        install_requirements(missing)
+    return missing
 
 
 def main(argv: List[str] | None = None) -> int:
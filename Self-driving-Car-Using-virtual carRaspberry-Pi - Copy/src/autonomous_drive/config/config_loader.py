@@ -3,15 +3,40 @@ Configuration Loader Module
 Loads and manages YAML configuration files
 """
 
+import copy
+import functools
+import json
 import os
 from typing import Any, Dict
 
 import yaml
+from types import MappingProxyType
+
+try:
+    # LibYAML-backed loader: typically an order of magnitude faster than
+    # the pure-Python parser, which dominates cold start on the Pi.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from autonomous_drive.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Sentinel stored in the flat cache for keys that resolved to nothing.
+_MISSING = object()
+
+# Parsed-YAML cache keyed by path, holding (mtime_ns, pristine tree).  A
+# reload of an unchanged file costs one stat instead of a full re-parse;
+# entries are replaced in place so each path is cached at most once.
+_YAML_CACHE: Dict[str, tuple] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dotted key once and memoize the parts for repeat lookups."""
+    return tuple(key.split('.'))
+
 
 class ConfigLoader:
     """
@@ -21,6 +46,13 @@ class ConfigLoader:
     
     _instance = None
     _config = {}
+    # Lazily populated dotted-key -> value cache; repeated get() calls on
+    # hot keys become a single dict probe instead of a split plus walk.
+    _flat_cache = {}
+    # Read-only view of _config handed out by get_all; rebuilt only when
+    # the underlying dict object is replaced.
+    _config_view = None
+    _config_view_source = None
     
     def __new__(cls):
         """Singleton pattern - only one instance."""
@@ -44,6 +76,7 @@ class ConfigLoader:
             FileNotFoundError: If config file not found
             yaml.YAMLError: If YAML parsing fails
         """
+        self._flat_cache.clear()
         try:
             if not os.path.exists(config_file):
                 logger.warning(f"Config file not found: {config_file}")
@@ -51,8 +84,34 @@ class ConfigLoader:
                 self._config = self._get_default_config()
                 return
             
-            with open(config_file, 'r') as f:
-                self._config = yaml.safe_load(f)
+            mtime_ns = os.stat(config_file).st_mtime_ns
+            cached = _YAML_CACHE.get(config_file)
+            if cached is not None and cached[0] == mtime_ns:
+                # Deep-copied on the way out so set() cannot pollute the
+                # cached pristine tree.
+                self._config = copy.deepcopy(cached[1])
+                logger.info(f"✅ Configuration loaded from cache for {config_file}")
+                return
+            
+            # Warm starts read the JSON sidecar written after the last
+            # successful parse: CPython's json parser is far faster than
+            # YAML, so the YAML file only gets parsed when it is newer.
+            sidecar = config_file + '.json'
+            loaded = None
+            try:
+                if os.stat(sidecar).st_mtime_ns >= mtime_ns:
+                    with open(sidecar, 'r') as f:
+                        loaded = json.load(f)
+            except (OSError, ValueError):
+                loaded = None
+            
+            if loaded is None:
+                with open(config_file, 'r') as f:
+                    loaded = yaml.load(f, Loader=_YamlLoader)
+                self._write_sidecar(sidecar, loaded)
+            
+            self._config = loaded
+            _YAML_CACHE[config_file] = (mtime_ns, copy.deepcopy(loaded))
             
             logger.info(f"✅ Configuration loaded from {config_file}")
         except yaml.YAMLError as e:
@@ -62,6 +121,23 @@ class ConfigLoader:
             logger.error(f"Failed to load configuration: {e}", exc_info=True)
             self._config = self._get_default_config()
     
+    @staticmethod
+    def _write_sidecar(sidecar: str, config: Dict[str, Any]) -> None:
+        """
+        Atomically write the JSON sidecar used for fast warm starts.
+        
+        Args:
+            sidecar (str): Path of the sidecar file
+            config (Dict): Parsed configuration to serialise
+        """
+        try:
+            tmp_path = sidecar + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(config, f, separators=(',', ':'))
+            os.replace(tmp_path, sidecar)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Could not write config sidecar {sidecar}: {e}")
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
@@ -78,17 +154,23 @@ class ConfigLoader:
             >>> max_speed = config.get("vehicle.max_speed", 50)
         """
         try:
-            keys = key.split('.')
+            cached = self._flat_cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached if cached is not None else default
+            
             value = self._config
             
-            for k in keys:
+            for k in _split_key(key):
                 if isinstance(value, dict):
                     value = value.get(k)
                     if value is None:
+                        self._flat_cache[key] = None
                         return default
                 else:
+                    self._flat_cache[key] = None
                     return default
             
+            self._flat_cache[key] = value
             return value if value is not None else default
         except Exception as e:
             logger.warning(f"Error getting config key '{key}': {e}")
@@ -107,7 +189,7 @@ class ConfigLoader:
             >>> config.set("vehicle.max_speed", 60)
         """
         try:
-            keys = key.split('.')
+            keys = _split_key(key)
             config = self._config
             
             for k in keys[:-1]:
@@ -116,18 +198,34 @@ class ConfigLoader:
                 config = config[k]
             
             config[keys[-1]] = value
+            self._flat_cache.clear()
             logger.debug(f"Configuration updated: {key} = {value}")
         except Exception as e:
             logger.error(f"Error setting config key '{key}': {e}", exc_info=True)
     
     def get_all(self) -> Dict[str, Any]:
         """
-        Get entire configuration dictionary.
+        Get a read-only view of the entire configuration.
+        
+        The view is zero-copy and tracks later set() updates; callers that
+        need to mutate the result should use get_all_mutable_copy().
         
         Returns:
-            Dict: Complete configuration
+            Dict: Complete configuration (read-only mapping)
         """
-        return self._config.copy()
+        if ConfigLoader._config_view_source is not self._config:
+            ConfigLoader._config_view = MappingProxyType(self._config)
+            ConfigLoader._config_view_source = self._config
+        return ConfigLoader._config_view
+    
+    def get_all_mutable_copy(self) -> Dict[str, Any]:
+        """
+        Get a deep copy of the entire configuration for mutation.
+        
+        Returns:
+            Dict: Independent copy of the complete configuration
+        """
+        return copy.deepcopy(self._config)
     
     def reload(self, config_file: str = "config/config.yaml") -> None:
         """
@@ -138,6 +236,7 @@ class ConfigLoader:
         """
         logger.info(f"Reloading configuration from {config_file}")
         self._config = {}
+        self._flat_cache.clear()
         self.load_config(config_file)
     
     @staticmethod
@@ -145,36 +244,44 @@ class ConfigLoader:
         """
         Get default configuration.
         
+        Returns a deep copy of the module-level template so that set() can
+        mutate the active configuration without touching the defaults.
+        
         Returns:
             Dict: Default configuration values
         """
-        return {
-            'vehicle': {
-                'max_speed': 50,
-                'min_distance_threshold': 0.3,
-                'emergency_stop_distance': 0.2
-            },
-            'vision': {
-                'lane_detection': {'enabled': True, 'interval': 5},
-                'object_detection': {'enabled': True, 'confidence_threshold': 0.5},
-                'traffic_light': {'enabled': True}
-            },
-            'sensors': {
-                'ultrasonic': {'enabled': True, 'timeout': 1.0},
-                'camera': {'enabled': True}
-            },
-            'logging': {
-                'level': 'INFO',
-                'file': 'logs/vehicle.log'
-            },
-            'safety': {
-                'emergency': {
-                    'acceleration_threshold': 8.0,
-                    'impact_threshold': 15.0,
-                    'rollover_threshold': 6.0
-                }
-            }
+        return copy.deepcopy(_DEFAULT_CONFIG)
+
+
+# Default configuration template, built once at import time instead of as a
+# fresh literal on every fallback.
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'vehicle': {
+        'max_speed': 50,
+        'min_distance_threshold': 0.3,
+        'emergency_stop_distance': 0.2
+    },
+    'vision': {
+        'lane_detection': {'enabled': True, 'interval': 5},
+        'object_detection': {'enabled': True, 'confidence_threshold': 0.5},
+        'traffic_light': {'enabled': True}
+    },
+    'sensors': {
+        'ultrasonic': {'enabled': True, 'timeout': 1.0},
+        'camera': {'enabled': True}
+    },
+    'logging': {
+        'level': 'INFO',
+        'file': 'logs/vehicle.log'
+    },
+    'safety': {
+        'emergency': {
+            'acceleration_threshold': 8.0,
+            'impact_threshold': 15.0,
+            'rollover_threshold': 6.0
         }
+    }
+}
 
 
 # Create singleton instance
@@ -4,6 +4,7 @@ Centralized GPIO pin definitions for Raspberry Pi
 """
 
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
 @dataclass
@@ -32,50 +33,57 @@ class GPIOConfig:
     # PWM Pins (for speed control, if using PWM)
     PWM_FREQUENCY: int = 1000  # 1kHz
     
+    # Pin groupings computed once at class-body time.  The accessors hand
+    # back these shared immutable objects instead of rebuilding a fresh
+    # dict/list on every call.
+    _ALL_PINS = MappingProxyType({
+        'ultrasonic_trig': ULTRASONIC_TRIG,
+        'ultrasonic_echo': ULTRASONIC_ECHO,
+        'led': LED_PIN,
+        'motor_left_forward': MOTOR_LEFT_FORWARD,
+        'motor_left_backward': MOTOR_LEFT_BACKWARD,
+        'motor_right_forward': MOTOR_RIGHT_FORWARD,
+        'motor_right_backward': MOTOR_RIGHT_BACKWARD,
+    })
+    _OUTPUT_PINS = (
+        ULTRASONIC_TRIG,
+        LED_PIN,
+        MOTOR_LEFT_FORWARD,
+        MOTOR_LEFT_BACKWARD,
+        MOTOR_RIGHT_FORWARD,
+        MOTOR_RIGHT_BACKWARD,
+    )
+    _INPUT_PINS = (ULTRASONIC_ECHO,)
+    
     @classmethod
-    def get_all_pins(cls) -> dict:
+    def get_all_pins(cls) -> MappingProxyType:
         """
-        Get all GPIO pins as a dictionary.
+        Get all GPIO pins as a read-only mapping.
         
         Returns:
-            dict: Dictionary of all GPIO pins with their purposes
+            MappingProxyType: Read-only mapping of all GPIO pins with their purposes
         """
-        return {
-            'ultrasonic_trig': cls.ULTRASONIC_TRIG,
-            'ultrasonic_echo': cls.ULTRASONIC_ECHO,
-            'led': cls.LED_PIN,
-            'motor_left_forward': cls.MOTOR_LEFT_FORWARD,
-            'motor_left_backward': cls.MOTOR_LEFT_BACKWARD,
-            'motor_right_forward': cls.MOTOR_RIGHT_FORWARD,
-            'motor_right_backward': cls.MOTOR_RIGHT_BACKWARD,
-        }
+        return cls._ALL_PINS
     
     @classmethod
-    def get_output_pins(cls) -> list:
+    def get_output_pins(cls) -> tuple:
         """
         Get all output pins (pins that need to be set as GPIO.OUT).
         
         Returns:
-            list: List of output pin numbers
+            tuple: Output pin numbers
         """
-        return [
-            cls.ULTRASONIC_TRIG,
-            cls.LED_PIN,
-            cls.MOTOR_LEFT_FORWARD,
-            cls.MOTOR_LEFT_BACKWARD,
-            cls.MOTOR_RIGHT_FORWARD,
-            cls.MOTOR_RIGHT_BACKWARD,
-        ]
+        return cls._OUTPUT_PINS
     
     @classmethod
-    def get_input_pins(cls) -> list:
+    def get_input_pins(cls) -> tuple:
         """
         Get all input pins (pins that need to be set as GPIO.IN).
         
         Returns:
-            list: List of input pin numbers
+            tuple: Input pin numbers
         """
-        return [cls.ULTRASONIC_ECHO]
+        return cls._INPUT_PINS
 
 
 # Create a singleton instance for easy import
@@ -3,6 +3,10 @@ Motor Controller Module
 Centralized motor control for the autonomous vehicle
 """
 
+import select
+import threading
+from typing import Callable, Optional
+
 try:
     import RPi.GPIO as GPIO
 except (ImportError, RuntimeError):
@@ -30,9 +34,21 @@ except (ImportError, RuntimeError):
     
     GPIO = MockGPIO()
 
+try:
+    import pigpio
+except ImportError:
+    # pigpio is optional; without it pin writes fall back to RPi.GPIO
+    pigpio = None
+
+try:
+    import gpiod
+except ImportError:
+    # libgpiod is optional; without it input pins stay plain GPIO.input reads
+    gpiod = None
+
 from autonomous_drive.config.gpio_config import GPIOConfig
 from autonomous_drive.utils.logger import get_logger
-from autonomous_drive.utils.validators import Validator, ValidationError
+from autonomous_drive.utils.validators import ValidationError, validate_speed
 
 
 class MotorController:
@@ -53,6 +69,24 @@ class MotorController:
         self.last_action = "STOP"
         self.current_speed = 0
         
+        # Motor pins in a fixed order plus a cache of precomputed
+        # set/clear bitmasks, so pigpio can apply a whole drive state in
+        # two bank writes instead of four per-pin calls.
+        self._motor_pins = (
+            self.config.MOTOR_LEFT_FORWARD,
+            self.config.MOTOR_LEFT_BACKWARD,
+            self.config.MOTOR_RIGHT_FORWARD,
+            self.config.MOTOR_RIGHT_BACKWARD,
+        )
+        self._bank_masks = {}
+        self._pi = None
+        
+        # Optional kernel edge-event machinery for the input pins; consumers
+        # register a callback instead of polling GPIO.input in a loop.
+        self.on_emergency: Optional[Callable[[], None]] = None
+        self._event_lines = []
+        self._event_thread = None
+        
         self._setup_gpio()
     
     def _setup_gpio(self):
@@ -72,6 +106,89 @@ class MotorController:
             self.logger.info("GPIO setup completed successfully")
         except Exception as e:
             self.logger.error(f"GPIO setup failed: {e}")
+        
+        if pigpio is not None:
+            pi = pigpio.pi()
+            if pi.connected:
+                self._pi = pi
+                self.logger.info("pigpio connected - using batched bank writes")
+            else:
+                self.logger.warning("pigpio daemon not running - using RPi.GPIO")
+        
+        self._setup_edge_events()
+    
+    def _setup_edge_events(self):
+        """Arm kernel-delivered edge events on the input pins.
+        
+        Waiting on the gpiochip line file descriptors with epoll replaces
+        user-space polling of GPIO.input: the thread sleeps at ~0% CPU and
+        an emergency edge wakes it in microseconds rather than a polling
+        interval later.  Without libgpiod this is silently skipped.
+        """
+        if gpiod is None:
+            return
+        
+        try:
+            chip = gpiod.Chip("gpiochip0")
+            for pin in self.config.get_input_pins():
+                line = chip.get_line(pin)
+                line.request(consumer="autonomous_drive", type=gpiod.LINE_REQ_EV_BOTH_EDGES)
+                self._event_lines.append(line)
+        except Exception as e:
+            self.logger.warning(f"GPIO edge events unavailable: {e}")
+            self._event_lines = []
+            return
+        
+        if self._event_lines:
+            self._event_thread = threading.Thread(target=self._event_loop, daemon=True)
+            self._event_thread.start()
+            self.logger.info("Edge-event monitoring armed on input pins")
+    
+    def _event_loop(self):
+        """Block on epoll over the line FDs and dispatch the callback."""
+        poller = select.epoll()
+        lines_by_fd = {}
+        for line in self._event_lines:
+            fd = line.event_get_fd()
+            lines_by_fd[fd] = line
+            poller.register(fd, select.EPOLLIN | select.EPOLLPRI)
+        
+        while True:
+            for fd, _ in poller.poll():
+                lines_by_fd[fd].event_read()
+                callback = self.on_emergency
+                if callback is not None:
+                    callback()
+    
+    def _drive(self, left_forward: int, left_backward: int,
+               right_forward: int, right_backward: int) -> None:
+        """Apply a full drive state to all four motor pins.
+        
+        With pigpio the state goes out as one set-bank and one clear-bank
+        register write; otherwise each pin is written through RPi.GPIO.
+        """
+        levels = (left_forward, left_backward, right_forward, right_backward)
+        
+        if self._pi is not None:
+            masks = self._bank_masks.get(levels)
+            if masks is None:
+                set_mask = clear_mask = 0
+                for pin, level in zip(self._motor_pins, levels):
+                    if level:
+                        set_mask |= 1 << pin
+                    else:
+                        clear_mask |= 1 << pin
+                masks = (set_mask, clear_mask)
+                self._bank_masks[levels] = masks
+            
+            if masks[0]:
+                self._pi.set_bank_1(masks[0])
+            if masks[1]:
+                self._pi.clear_bank_1(masks[1])
+            return
+        
+        for pin, level in zip(self._motor_pins, levels):
+            GPIO.output(pin, level)
     
     def forward(self, speed: int = 30) -> None:
         """
@@ -84,16 +201,17 @@ class MotorController:
             ValidationError: If speed is invalid
         """
         try:
-            Validator.validate_speed(speed, 0, 100)
+            validate_speed(speed, 0, 100)
 
-            GPIO.output(self.config.MOTOR_LEFT_FORWARD, 1)
-            GPIO.output(self.config.MOTOR_LEFT_BACKWARD, 0)
-            GPIO.output(self.config.MOTOR_RIGHT_FORWARD, 1)
-            GPIO.output(self.config.MOTOR_RIGHT_BACKWARD, 0)
+            # Motor state repeats on most frames; only a change is worth a
+            # trip through the logging machinery.
+            state_changed = self.last_action != "FORWARD" or self.current_speed != speed
+            self._drive(1, 0, 1, 0)
 
             self.last_action = "FORWARD"
             self.current_speed = speed
-            self.logger.info(f"🚗 Moving forward at {speed} km/h")
+            if state_changed:
+                self.logger.info("🚗 Moving forward at %s km/h", speed)
         except ValidationError as e:
             self.logger.error(f"Invalid speed: {e}")
             raise
@@ -108,14 +226,15 @@ class MotorController:
             speed (int): Speed in km/h (0-100)
         """
         try:
-            GPIO.output(self.config.MOTOR_LEFT_FORWARD, 0)
-            GPIO.output(self.config.MOTOR_LEFT_BACKWARD, 1)
-            GPIO.output(self.config.MOTOR_RIGHT_FORWARD, 0)
-            GPIO.output(self.config.MOTOR_RIGHT_BACKWARD, 1)
+            # Motor state repeats on most frames; only a change is worth a
+            # trip through the logging machinery.
+            state_changed = self.last_action != "BACKWARD" or self.current_speed != speed
+            self._drive(0, 1, 0, 1)
             
             self.last_action = "BACKWARD"
             self.current_speed = speed
-            self.logger.info(f"🔙 Moving backward at {speed} km/h")
+            if state_changed:
+                self.logger.info("🔙 Moving backward at %s km/h", speed)
         except Exception as e:
             self.logger.error(f"Backward motion failed: {e}")
     
@@ -127,14 +246,15 @@ class MotorController:
             speed (int): Speed in km/h (0-100)
         """
         try:
-            GPIO.output(self.config.MOTOR_LEFT_FORWARD, 0)
-            GPIO.output(self.config.MOTOR_LEFT_BACKWARD, 0)
-            GPIO.output(self.config.MOTOR_RIGHT_FORWARD, 1)
-            GPIO.output(self.config.MOTOR_RIGHT_BACKWARD, 0)
+            # Motor state repeats on most frames; only a change is worth a
+            # trip through the logging machinery.
+            state_changed = self.last_action != "LEFT" or self.current_speed != speed
+            self._drive(0, 0, 1, 0)
             
             self.last_action = "LEFT"
             self.current_speed = speed
-            self.logger.info(f"↪️ Turning left at {speed} km/h")
+            if state_changed:
+                self.logger.info("↪️ Turning left at %s km/h", speed)
         except Exception as e:
             self.logger.error(f"Left turn failed: {e}")
     
@@ -146,28 +266,28 @@ class MotorController:
             speed (int): Speed in km/h (0-100)
         """
         try:
-            GPIO.output(self.config.MOTOR_LEFT_FORWARD, 1)
-            GPIO.output(self.config.MOTOR_LEFT_BACKWARD, 0)
-            GPIO.output(self.config.MOTOR_RIGHT_FORWARD, 0)
-            GPIO.output(self.config.MOTOR_RIGHT_BACKWARD, 0)
+            # Motor state repeats on most frames; only a change is worth a
+            # trip through the logging machinery.
+            state_changed = self.last_action != "RIGHT" or self.current_speed != speed
+            self._drive(1, 0, 0, 0)
             
             self.last_action = "RIGHT"
             self.current_speed = speed
-            self.logger.info(f"↩️ Turning right at {speed} km/h")
+            if state_changed:
+                self.logger.info("↩️ Turning right at %s km/h", speed)
         except Exception as e:
             self.logger.error(f"Right turn failed: {e}")
     
     def stop(self) -> None:
         """Stop all motors immediately."""
         try:
-            GPIO.output(self.config.MOTOR_LEFT_FORWARD, 0)
-            GPIO.output(self.config.MOTOR_LEFT_BACKWARD, 0)
-            GPIO.output(self.config.MOTOR_RIGHT_FORWARD, 0)
-            GPIO.output(self.config.MOTOR_RIGHT_BACKWARD, 0)
+            state_changed = self.last_action != "STOP"
+            self._drive(0, 0, 0, 0)
             
             self.last_action = "STOP"
             self.current_speed = 0
-            self.logger.info("🛑 All motors stopped")
+            if state_changed:
+                self.logger.info("🛑 All motors stopped")
         except Exception as e:
             self.logger.error(f"Stop operation failed: {e}")
     
@@ -175,6 +295,9 @@ class MotorController:
         """Clean up GPIO resources."""
         try:
             self.stop()
+            if self._pi is not None:
+                self._pi.stop()
+                self._pi = None
             GPIO.cleanup()
             self.logger.info("GPIO cleanup completed")
         except Exception as e:
@@ -1,11 +1,11 @@
 """Sensor diagnostics utilities for the autonomous vehicle prototype."""
 
+import collections
 import json
-import os
+import queue
 import random
 import threading
 import time
-from datetime import datetime
 from typing import Dict, Tuple
 
 import cv2
@@ -15,6 +15,34 @@ import numpy as np
 class CameraMonitor:
     """Monitor camera health including brightness, blur and frame freezes."""
 
+    # Fixed slots instead of a per-instance __dict__: these attributes are
+    # read dozens of times per frame and slot access is the cheaper lookup.
+    __slots__ = (
+        "camera_working",
+        "camera_blurred",
+        "camera_dark",
+        "camera_covered",
+        "camera_frozen",
+        "camera_fps",
+        "last_frame_time",
+        "_small_prev",
+        "consecutive_identical_frames",
+        "capture",
+        "blur_threshold",
+        "dark_threshold",
+        "covered_threshold",
+        "consecutive_failures",
+        "frame_counter",
+        "_lap_buf",
+        "_qa_small",
+        "_gray_buf",
+        "_grab_thread",
+        "_grab_lock",
+        "_grabbing",
+        "_latest",
+        "_frame_ready",
+    )
+
     def __init__(self) -> None:
         self.camera_working = False
         self.camera_blurred = False
@@ -22,8 +50,12 @@ class CameraMonitor:
         self.camera_covered = False
         self.camera_frozen = False
         self.camera_fps = 0.0
-        self.last_frame_time = 0.0
-        self.last_frame = None
+        # Monotonic nanosecond stamp of the previous frame; immune to NTP
+        # clock steps that would otherwise produce negative FPS deltas.
+        self.last_frame_time = 0
+        # 80x60 grayscale of the previous frame; plenty for a freeze check
+        # and ~190x less data to keep around than a full colour copy.
+        self._small_prev = None
         self.consecutive_identical_frames = 0
         self.capture = None
         self.blur_threshold = 50
@@ -31,6 +63,23 @@ class CameraMonitor:
         self.covered_threshold = 5
         self.consecutive_failures = 0
         self.frame_counter = 0
+        # Reused CV_16S Laplacian output; avoids a fresh float64 frame-sized
+        # allocation on every quality check.
+        self._lap_buf = None
+        # Reused 320x240 downscale the quality metrics run on; blur and
+        # brightness are scale-tolerant, so analysing a quarter of the
+        # pixels moves a quarter of the bytes.
+        self._qa_small = None
+        # Reused full-resolution grayscale destination for cvtColor.
+        self._gray_buf = None
+        # Grabber thread state: capture.read runs on its own daemon thread
+        # into a latest-frame slot, so a health tick never blocks for the
+        # driver's ~33 ms frame interval.
+        self._grab_thread = None
+        self._grab_lock = threading.Lock()
+        self._grabbing = False
+        self._latest = (False, None)
+        self._frame_ready = threading.Event()
 
     def check_camera_operation(self) -> bool:
         """Attempt to read from the camera and update health indicators."""
@@ -38,7 +87,12 @@ class CameraMonitor:
         try:
             if self.capture is None:
                 print("📷 Initializing camera...")
-                self.capture = cv2.VideoCapture(0)
+                # Prefer the V4L2 backend so the buffer-size hint below is
+                # honoured; a single driver buffer plus MJPG keeps reads on
+                # fresh frames instead of the driver's stale queue.
+                self.capture = cv2.VideoCapture(0, cv2.CAP_V4L2)
+                if not self.capture.isOpened():
+                    self.capture = cv2.VideoCapture(0)
                 if not self.capture.isOpened():
                     for i in range(1, 4):
                         self.capture = cv2.VideoCapture(i)
@@ -50,11 +104,29 @@ class CameraMonitor:
                         self.camera_working = False
                         return False
 
+                self.capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
                 self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
                 self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                 time.sleep(1)
 
-            ret, frame = self.capture.read()
+            if self._grab_thread is None:
+                self._grabbing = True
+                self._grab_thread = threading.Thread(target=self._grab_loop, daemon=True)
+                self._grab_thread.start()
+
+            # Consume the freshest grabbed frame; waiting on the event means
+            # each tick scores a new frame rather than re-reading the slot.
+            if self._frame_ready.wait(timeout=1.0):
+                self._frame_ready.clear()
+                with self._grab_lock:
+                    ret, frame = self._latest
+            else:
+                ret, frame = False, None
+            if ret and frame is not None and not frame.flags["C_CONTIGUOUS"]:
+                # Keep the analysis path on contiguous uint8 data so the
+                # OpenCV calls below avoid implicit copies.
+                frame = np.ascontiguousarray(frame)
             if not ret or frame is None or frame.size == 0:
                 self.consecutive_failures += 1
                 if self.consecutive_failures > 3:
@@ -66,28 +138,67 @@ class CameraMonitor:
             self.camera_working = True
             self.frame_counter += 1
 
-            self._analyze_frame_quality(frame)
-            self._check_frozen_frame(frame)
+            # One grayscale conversion feeds both the quality analysis and
+            # the freeze check.  A capture configured to hand back a raw
+            # luma plane (CAP_PROP_CONVERT_RGB=0 on a YUV source) arrives
+            # single-channel and skips the conversion entirely.
+            if frame.ndim == 2:
+                gray = frame
+            else:
+                if self._gray_buf is None or self._gray_buf.shape != frame.shape[:2]:
+                    self._gray_buf = np.empty(frame.shape[:2], np.uint8)
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+            self._analyze_frame_quality(gray)
+            self._check_frozen_frame(gray)
 
-            current_time = time.time()
+            current_time = time.monotonic_ns()
             if self.last_frame_time > 0:
-                time_diff = current_time - self.last_frame_time
-                if time_diff > 0:
-                    self.camera_fps = 1.0 / time_diff
+                time_diff_ns = current_time - self.last_frame_time
+                if time_diff_ns > 0:
+                    self.camera_fps = 1e9 / time_diff_ns
             self.last_frame_time = current_time
-
-            self.last_frame = frame.copy()
             return True
         except Exception as exc:  # pragma: no cover - hardware specific
             print(f"❌ Camera error: {exc}")
             self.camera_working = False
             return False
 
-    def _analyze_frame_quality(self, frame: np.ndarray) -> None:
+    def _grab_loop(self) -> None:
+        """Continuously read frames into the latest-frame slot."""
+
+        while self._grabbing:
+            capture = self.capture
+            if capture is None:
+                break
+            try:
+                ret, frame = capture.read()
+            except Exception:  # pragma: no cover - hardware specific
+                ret, frame = False, None
+            with self._grab_lock:
+                self._latest = (ret, frame)
+            self._frame_ready.set()
+
+    def _stop_grabber(self) -> None:
+        self._grabbing = False
+        thread = self._grab_thread
+        if thread is not None:
+            thread.join(timeout=1.0)
+            self._grab_thread = None
+        self._frame_ready.clear()
+
+    def _analyze_frame_quality(self, gray: np.ndarray) -> None:
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
-            brightness = np.mean(gray)
+            if self._qa_small is None:
+                self._qa_small = np.empty((240, 320), np.uint8)
+                self._lap_buf = np.empty((240, 320), np.int16)
+            small = self._qa_small
+            cv2.resize(gray, (320, 240), dst=small, interpolation=cv2.INTER_AREA)
+            # CV_16S halves the Laplacian bytes versus CV_64F, and
+            # meanStdDev hands back the variance in the same single pass.
+            cv2.Laplacian(small, cv2.CV_16S, dst=self._lap_buf, ksize=3)
+            _, lap_std = cv2.meanStdDev(self._lap_buf)
+            laplacian_var = float(lap_std[0, 0]) ** 2
+            brightness = cv2.mean(small)[0]
 
             self.camera_covered = brightness < self.covered_threshold
             self.camera_blurred = laplacian_var < self.blur_threshold and not self.camera_covered
@@ -109,17 +220,20 @@ class CameraMonitor:
         except Exception as exc:  # pragma: no cover
             print(f"Frame analysis error: {exc}")
 
-    def _check_frozen_frame(self, current_frame: np.ndarray) -> None:
-        if self.last_frame is not None and current_frame.shape == self.last_frame.shape:
-            diff = cv2.absdiff(current_frame, self.last_frame)
-            non_zero_count = np.count_nonzero(diff)
+    def _check_frozen_frame(self, gray: np.ndarray) -> None:
+        small = cv2.resize(gray, (80, 60), interpolation=cv2.INTER_AREA)
+        if self._small_prev is not None:
+            # One L1-norm call gives the sum of absolute differences
+            # directly, replacing the absdiff buffer plus count pass.
+            sad = cv2.norm(small, self._small_prev, cv2.NORM_L1)
 
-            if non_zero_count < 1000:
+            if sad < 20:
                 self.consecutive_identical_frames += 1
                 self.camera_frozen = self.consecutive_identical_frames > 10
             else:
                 self.consecutive_identical_frames = 0
                 self.camera_frozen = False
+        self._small_prev = small
 
     def get_camera_status(self) -> Tuple[str, str]:
         if not self.camera_working:
@@ -136,6 +250,7 @@ class CameraMonitor:
 
     def _reset_camera(self) -> None:
         try:
+            self._stop_grabber()
             if self.capture:
                 self.capture.release()
                 self.capture = None
@@ -144,6 +259,7 @@ class CameraMonitor:
             pass
 
     def cleanup(self) -> None:
+        self._stop_grabber()
         if self.capture:
             self.capture.release()
         cv2.destroyAllWindows()
@@ -212,41 +328,63 @@ class SensorMonitor:
             "lidar": {"obstacles_detected": 0},
             "ultrasonic": {"front_distance": 0.0, "rear_distance": 0.0},
         }
-        self.log_file = "sensor_logs.json"
+        self.log_file = "sensor_logs.ndjson"
         self.log_lock = threading.Lock()
+        # In-memory ring of the most recent serialised entries; compact()
+        # rewrites the file from it on shutdown so the log stays bounded
+        # without ever re-reading the file during operation.
+        self._log_buffer = collections.deque(maxlen=100)
+        # Serialised lines are handed to a background writer that batches
+        # everything queued into a single writelines per wake-up, the same
+        # scheme the perception action log uses.
+        self._log_queue: "queue.Queue" = queue.Queue()
+        self._log_thread = None
+        # Simulation noise comes from a pre-generated ring of uniform(-1, 1)
+        # rows: one NumPy RNG call per 1024 ticks instead of a dozen
+        # random.uniform calls per tick.
+        self._rng = np.random.default_rng()
+        self._noise = self._rng.uniform(-1.0, 1.0, (1024, 12)).astype(np.float32)
+        self._noise_index = 0
+
+    def _next_noise(self) -> np.ndarray:
+        row = self._noise[self._noise_index]
+        self._noise_index = (self._noise_index + 1) & 1023
+        return row
 
     def update_sensors(self) -> Dict[str, Dict[str, float]]:
-        self._simulate_imu_data()
-        self._update_gps_data()
-        self._simulate_battery()
-        self._simulate_motor_temperature()
-        self._simulate_ultrasonic()
-        self._simulate_lidar()
+        noise = self._next_noise()
+        self._simulate_imu_data(noise)
+        self._update_gps_data(noise)
+        self._simulate_battery(noise)
+        self._simulate_motor_temperature(noise)
+        self._simulate_ultrasonic(noise)
+        self._simulate_lidar(noise)
         self._log_sensor_data()
         return self.sensor_data
 
-    def _simulate_imu_data(self) -> None:
-        self.sensor_data["imu"]["acceleration_x"] = round(random.uniform(-2, 2), 2)
-        self.sensor_data["imu"]["acceleration_y"] = round(random.uniform(-2, 2), 2)
-        self.sensor_data["imu"]["acceleration_z"] = round(9.8 + random.uniform(-0.5, 0.5), 2)
-        self.sensor_data["imu"]["gyro_x"] = round(random.uniform(-5, 5), 2)
-        self.sensor_data["imu"]["gyro_y"] = round(random.uniform(-5, 5), 2)
-        self.sensor_data["imu"]["gyro_z"] = round(random.uniform(-5, 5), 2)
+    def _simulate_imu_data(self, noise: np.ndarray) -> None:
+        self.sensor_data["imu"]["acceleration_x"] = round(float(noise[0]) * 2, 2)
+        self.sensor_data["imu"]["acceleration_y"] = round(float(noise[1]) * 2, 2)
+        self.sensor_data["imu"]["acceleration_z"] = round(9.8 + float(noise[2]) * 0.5, 2)
+        self.sensor_data["imu"]["gyro_x"] = round(float(noise[3]) * 5, 2)
+        self.sensor_data["imu"]["gyro_y"] = round(float(noise[4]) * 5, 2)
+        self.sensor_data["imu"]["gyro_z"] = round(float(noise[5]) * 5, 2)
 
-    def _update_gps_data(self) -> None:
+    def _update_gps_data(self, noise: np.ndarray) -> None:
         if self.gps_monitor.get_location():
             self.sensor_data["gps"]["latitude"] = round(self.gps_monitor.latitude, 6)
             self.sensor_data["gps"]["longitude"] = round(self.gps_monitor.longitude, 6)
             self.sensor_data["gps"]["location"] = self.gps_monitor.get_formatted_location()
-            self.sensor_data["gps"]["speed"] = round(random.uniform(0, 80), 1)
+            self.sensor_data["gps"]["speed"] = round((float(noise[6]) + 1.0) * 40, 1)
 
-    def _simulate_battery(self) -> None:
+    def _simulate_battery(self, noise: np.ndarray) -> None:
+        drain = 0.3 + float(noise[7]) * 0.2
         self.sensor_data["battery"]["charge_level"] = max(
-            0, self.sensor_data["battery"]["charge_level"] - random.uniform(0.1, 0.5)
+            0, self.sensor_data["battery"]["charge_level"] - drain
         )
 
-    def _simulate_motor_temperature(self) -> None:
-        temperature = self.sensor_data["motors"]["temperature"] + random.uniform(-0.5, 0.5)
+    def _simulate_motor_temperature(self, noise: np.ndarray) -> None:
+        temperature = self.sensor_data["motors"]["temperature"] + float(noise[8]) * 0.5
         temperature = min(max(temperature, 30.0), 75.0)
         self.sensor_data["motors"]["temperature"] = round(temperature, 2)
         if temperature > 65:
@@ -254,28 +392,69 @@ class SensorMonitor:
         else:
             self.sensor_data["motors"]["status"] = "OK"
 
-    def _simulate_ultrasonic(self) -> None:
-        self.sensor_data["ultrasonic"]["front_distance"] = round(random.uniform(0.5, 5.0), 2)
-        self.sensor_data["ultrasonic"]["rear_distance"] = round(random.uniform(0.5, 5.0), 2)
+    def _simulate_ultrasonic(self, noise: np.ndarray) -> None:
+        self.sensor_data["ultrasonic"]["front_distance"] = round(2.75 + float(noise[9]) * 2.25, 2)
+        self.sensor_data["ultrasonic"]["rear_distance"] = round(2.75 + float(noise[10]) * 2.25, 2)
 
-    def _simulate_lidar(self) -> None:
-        self.sensor_data["lidar"]["obstacles_detected"] = random.randint(0, 3)
+    def _simulate_lidar(self, noise: np.ndarray) -> None:
+        self.sensor_data["lidar"]["obstacles_detected"] = min(3, int((float(noise[11]) + 1.0) * 2))
 
     def _log_sensor_data(self) -> None:
+        """Append the current readings as one NDJSON line.
+
+        The previous implementation re-read and pretty-printed the whole
+        log file on every tick; appending a compact line to a persistent
+        handle keeps logging O(1) regardless of session length.
+        """
+
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            # C-level time.strftime is markedly cheaper than building a
+            # datetime and formatting it; second resolution is plenty for
+            # a once-per-tick log.
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
             "sensors": self.sensor_data,
         }
+        line = json.dumps(log_entry, separators=(",", ":")) + "\n"
         with self.log_lock:
-            if not os.path.exists(self.log_file):
-                with open(self.log_file, "w", encoding="utf-8") as handle:
-                    json.dump([log_entry], handle, indent=2)
-            else:
-                with open(self.log_file, "r", encoding="utf-8") as handle:
-                    data = json.load(handle)
-                data.append(log_entry)
+            self._log_buffer.append(line)
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(target=self._drain_logs, daemon=True)
+                self._log_thread.start()
+        self._log_queue.put(line)
+
+    def _drain_logs(self) -> None:
+        """Write queued log lines in batches until the shutdown sentinel."""
+
+        with open(self.log_file, "a", buffering=1 << 16, encoding="utf-8") as handle:
+            while True:
+                item = self._log_queue.get()
+                if item is None:
+                    return
+                lines = [item]
+                while True:
+                    try:
+                        item = self._log_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        handle.writelines(lines)
+                        return
+                    lines.append(item)
+                handle.writelines(lines)
+                handle.flush()
+
+    def compact(self) -> None:
+        """Rewrite the log file from the in-memory ring of recent entries."""
+
+        with self.log_lock:
+            thread = self._log_thread
+            if thread is not None:
+                self._log_queue.put(None)
+                thread.join(timeout=1.0)
+                self._log_thread = None
+            if self._log_buffer:
                 with open(self.log_file, "w", encoding="utf-8") as handle:
-                    json.dump(data[-100:], handle, indent=2)
+                    handle.writelines(self._log_buffer)
 
     def get_status_report(self) -> Dict[str, Dict[str, float]]:
         camera_status = self.camera_monitor.get_camera_status()
@@ -295,6 +474,7 @@ class SensorMonitor:
         return report
 
     def shutdown(self) -> None:
+        self.compact()
         self.camera_monitor.cleanup()
 
 
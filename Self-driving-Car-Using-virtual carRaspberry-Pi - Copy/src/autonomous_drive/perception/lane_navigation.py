@@ -8,17 +8,101 @@ improve readability and maintainability.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
+import os
+import queue
+import threading
 import time
 import urllib.request
 
+from autonomous_drive.perception.trt_backend import TRTYoloBackend
 from autonomous_drive.utils.logger import get_logger
 
+try:  # pragma: no cover - numba is an optional accelerator
+    from numba import njit
+except ImportError:  # pragma: no cover - running without numba
+    njit = None
+
+
+# ---------------------------------------------------------------------------
+# Detection postprocessing kernel
+# ---------------------------------------------------------------------------
+
+
+def _decode_predictions(
+    predictions: np.ndarray,
+    road_idx: np.ndarray,
+    threshold: float,
+    width: int,
+    height: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decode concatenated YOLO predictions into boxes, scores and class ids.
+
+    Only the columns listed in ``road_idx`` are scored: arg-maxing the eight
+    road classes instead of all eighty COCO classes touches a tenth of the
+    memory on this memory-bound path.  This NumPy implementation is the
+    fallback used when ``numba`` is not installed; the JIT-compiled variant
+    below replaces it when available.
+    """
+
+    sub_scores = predictions[:, 5:][:, road_idx]
+    local_best = sub_scores.argmax(axis=1)
+    confidences = sub_scores[np.arange(len(predictions)), local_best]
+    class_ids = road_idx[local_best]
+    keep = confidences > threshold
+
+    kept = predictions[keep, :4] * np.array([width, height, width, height], dtype=np.float32)
+    box_xy = (kept[:, :2] - kept[:, 2:] / 2).astype(np.int64)
+    box_wh = kept[:, 2:].astype(np.int64)
+
+    boxes = np.hstack([box_xy, box_wh])
+    return boxes, confidences[keep].astype(np.float32), class_ids[keep].astype(np.int64)
+
+
+if njit is not None:  # pragma: no cover - exercised only with numba installed
+
+    @njit(cache=True, fastmath=True)
+    def _decode_predictions(predictions, road_idx, threshold, width, height):  # noqa: F811
+        """JIT-compiled decode loop; signature matches the NumPy fallback."""
+
+        total = predictions.shape[0]
+        boxes = np.empty((total, 4), np.int64)
+        confidences = np.empty(total, np.float32)
+        class_ids = np.empty(total, np.int64)
+        count = 0
+
+        for row in range(total):
+            best_score = threshold
+            best_class = -1
+            for j in range(road_idx.shape[0]):
+                score = predictions[row, 5 + road_idx[j]]
+                if score > best_score:
+                    best_score = score
+                    best_class = road_idx[j]
+            if best_class < 0:
+                continue
+
+            box_width = predictions[row, 2] * width
+            box_height = predictions[row, 3] * height
+            boxes[count, 0] = np.int64(predictions[row, 0] * width - box_width / 2)
+            boxes[count, 1] = np.int64(predictions[row, 1] * height - box_height / 2)
+            boxes[count, 2] = np.int64(box_width)
+            boxes[count, 3] = np.int64(box_height)
+            confidences[count] = best_score
+            class_ids[count] = best_class
+            count += 1
+
+        return boxes[:count], confidences[:count], class_ids[:count]
+
+
 # ---------------------------------------------------------------------------
 # Data containers
 # ---------------------------------------------------------------------------
@@ -90,9 +174,58 @@ class LaneNavigationSystem:
 
         # Internal state used to reduce the inference load on the CPU.
         self.last_detections: List[Detection] = []
+        self.last_lane_lines: Optional[np.ndarray] = None
+        self.last_roi_vertices: Optional[np.ndarray] = None
         self.frame_count: int = 0
         self.detection_interval: int = 5  # Run YOLO on every 5th frame by default.
 
+        # On a headless vehicle the overlay is never seen, yet every frame
+        # would still pay for rectangles, text and the alpha blend.  Drawing
+        # and the imshow/waitKey pair are skipped when no display exists.
+        self.display_enabled: bool = os.name == "nt" or bool(os.environ.get("DISPLAY"))
+
+        # YOLO inference and the Canny/Hough lane search both release the GIL
+        # inside OpenCV, so running them on separate threads overlaps the two
+        # dominant per-frame costs.
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
+        # Latest-frame buffer fed by the capture thread in :meth:`run`.  The
+        # processing loop always consumes the newest frame and stale ones are
+        # dropped, so latency cannot accumulate in the driver buffer.
+        self._frame_lock = threading.Lock()
+        self._latest_frame: Optional[np.ndarray] = None
+        self._capture_running = False
+        self._dropped_frames = 0
+
+        # Presentation runs on its own thread so imshow's window-server
+        # round trip and waitKey's event pump never block the processing
+        # loop; quit requests come back through an Event.
+        self._display_queue: "queue.Queue" = queue.Queue(maxsize=1)
+        self._quit_event = threading.Event()
+
+        # Scratch buffers reused by the manual blob path: the 320x320 resize
+        # lands in ``_resize_buffer`` and the normalised CHW tensor is built
+        # in place in ``_blob_scratch``, so neither step allocates a fresh
+        # 1.2 MB buffer per frame.
+        self._resize_buffer = np.empty((320, 320, 3), dtype=np.uint8)
+        self._blob_scratch = np.empty((1, 3, 320, 320), dtype=np.float32)
+
+        # The lane search always runs at 320x240, so its trapezoidal ROI is
+        # rasterised once here instead of a fillPoly per frame, and the
+        # intermediate images reuse fixed buffers via ``dst=``.
+        self._roi_polygon = np.array([[(0, 240), (80, 120), (240, 120), (320, 240)]], np.int32)
+        self._roi_mask = np.zeros((240, 320), np.uint8)
+        cv2.fillPoly(self._roi_mask, self._roi_polygon, 255)
+        self._lane_small = np.empty((240, 320, 3), np.uint8)
+        self._lane_gray = np.empty((240, 320), np.uint8)
+        self._lane_edges = np.empty((240, 320), np.uint8)
+
+        # Rendered-text tile cache: putText re-rasterises every Hershey
+        # stroke on every call, but the overlay's label set barely changes
+        # frame to frame, so each unique string is rendered once and then
+        # pasted as a masked memcpy.  Insertion order doubles as an LRU.
+        self._text_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
         # Prepare model artefacts.
         self._download_model_files()
         self._load_class_labels()
@@ -140,68 +273,258 @@ class LaneNavigationSystem:
         with labels_file.open("r", encoding="utf-8") as handle:
             self.class_labels: List[str] = [line.strip() for line in handle if line.strip()]
 
-        self.road_class_ids = [
+        # A frozenset gives O(1) membership tests for scalar class ids; the
+        # sorted index array below is the vectorized view of the same set,
+        # cached so neither is rebuilt per frame.
+        self.road_class_ids = frozenset(
             index
             for index, name in enumerate(self.class_labels)
             if name in self.ROAD_CLASS_COLOURS
-        ]
+        )
+        self._road_idx = np.array(sorted(self.road_class_ids), dtype=np.int64)
+        # Boolean lookup table indexed by class id: filtering a batch of
+        # ids becomes one gather instead of an np.isin set search.
+        self._is_road_class = np.zeros(len(self.class_labels), dtype=bool)
+        self._is_road_class[self._road_idx] = True
 
     def _load_yolo_network(self) -> None:
         """Load the YOLOv4-tiny model into OpenCV's DNN module."""
 
-        weights_file = self.model_directory / "yolov4-tiny.weights"
-        config_file = self.model_directory / "yolov4-tiny.cfg"
+        self.trt_backend = self._load_trt_backend()
 
-        if not weights_file.exists() or not config_file.exists():
-            raise FileNotFoundError("YOLO model files are missing – run download first")
+        self.net = self._load_quantized_network()
+        self._using_int8 = self.net is not None
+
+        if self.net is None:
+            weights_file = self.model_directory / "yolov4-tiny.weights"
+            config_file = self.model_directory / "yolov4-tiny.cfg"
+
+            if not weights_file.exists() or not config_file.exists():
+                raise FileNotFoundError("YOLO model files are missing – run download first")
+
+            self.net = cv2.dnn.readNet(str(weights_file), str(config_file))
 
-        self.net = cv2.dnn.readNet(str(weights_file), str(config_file))
         layer_names = self.net.getLayerNames()
         self.output_layers = [layer_names[i - 1] for i in self.net.getUnconnectedOutLayers()]
 
+        self._configure_backend()
+        self._build_detection_model()
+        self._warm_up_network()
+
         self.logger.info("YOLO model loaded successfully")
 
+    def _load_trt_backend(self) -> Optional[TRTYoloBackend]:
+        """Load a serialized TensorRT engine when present and supported.
+
+        On Jetson-class devices a ``yolov4-tiny.engine`` file built with the
+        EfficientNMS plugin runs decode and NMS fused on the GPU; one enqueue
+        replaces the whole blob/forward/NMS pipeline.  Without TensorRT (or
+        without the engine file) the OpenCV DNN paths are used unchanged.
+        """
+
+        engine_file = self.model_directory / "yolov4-tiny.engine"
+        if not engine_file.exists() or not TRTYoloBackend.is_available():
+            return None
+
+        try:
+            return TRTYoloBackend(engine_file)
+        except Exception as exc:  # pragma: no cover - driver specific
+            self.logger.warning("Failed to load TensorRT engine (%s) – using OpenCV DNN", exc)
+            return None
+
+    def _load_quantized_network(self) -> Optional[cv2.dnn.Net]:
+        """Load an INT8 OpenVINO IR model when one has been generated.
+
+        Quantizing the darknet weights offline (``mo`` followed by POT, or an
+        equivalent TFLite pipeline) lets the CPU use NEON/VNNI dot-product
+        instructions – roughly 2x faster on a Raspberry Pi 4 and up to 4x on
+        recent x86.  This method only picks up the resulting
+        ``yolov4-tiny-int8.{xml,bin}`` pair when it sits next to the FP32
+        weights; the FP32 darknet model remains the default.
+        """
+
+        model_xml = self.model_directory / "yolov4-tiny-int8.xml"
+        model_bin = self.model_directory / "yolov4-tiny-int8.bin"
+        if not model_xml.exists() or not model_bin.exists():
+            return None
+
+        try:
+            net = cv2.dnn.readNetFromModelOptimizer(str(model_xml), str(model_bin))
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+            net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            self.logger.info("Loaded INT8 quantized YOLO model from %s", model_xml.name)
+            return net
+        except cv2.error as exc:
+            self.logger.warning("Failed to load INT8 model (%s) – using FP32 weights", exc)
+            return None
+
+    def _build_detection_model(self) -> None:
+        """Wrap the network in ``cv2.dnn_DetectionModel`` when available.
+
+        The detection model fuses blob construction, the forward pass and NMS
+        into a single C++ call, removing several Python/C++ boundary crossings
+        per frame.  Older OpenCV builds without the wrapper fall back to the
+        manual decode pipeline.
+        """
+
+        try:
+            self.detection_model = cv2.dnn_DetectionModel(self.net)
+            self.detection_model.setInputParams(size=(320, 320), scale=1 / 255.0, swapRB=True)
+        except (AttributeError, cv2.error):
+            self.detection_model = None
+            self.logger.info("dnn_DetectionModel unavailable – using manual YOLO decode")
+
+    def _configure_backend(self) -> None:
+        """Select the fastest available DNN backend for the loaded network.
+
+        When OpenCV was built with CUDA support and a device is present the
+        network runs on the GPU with FP16 kernels, which is dramatically faster
+        than the default CPU path.  Cards that are slow at FP16 make the target
+        assignment fail, in which case we retry with full precision before
+        giving up and staying on the CPU.
+        """
+
+        if self._using_int8:
+            # The quantized model already pinned the inference-engine backend.
+            return
+
+        try:
+            cuda_devices = cv2.cuda.getCudaEnabledDeviceCount()
+        except (AttributeError, cv2.error):
+            cuda_devices = 0
+
+        if cuda_devices <= 0:
+            # No CUDA device: try OpenCL FP16 through the default backend
+            # (the transparent API), which the VideoCore and most iGPUs can
+            # host, before settling for the plain CPU path.
+            try:
+                if cv2.ocl.haveOpenCL():
+                    self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+                    self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_OPENCL_FP16)
+                    self.logger.info("YOLO inference using OpenCL FP16 target")
+                    return
+            except (AttributeError, cv2.error):
+                pass
+            self.logger.info("CUDA/OpenCL not available – YOLO inference will run on the CPU")
+            return
+
+        try:
+            self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+            try:
+                self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA_FP16)
+                self.logger.info("YOLO inference using CUDA backend with FP16 target")
+            except cv2.error:
+                self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+                self.logger.info("YOLO inference using CUDA backend with FP32 target")
+        except cv2.error as exc:
+            self.logger.warning("CUDA backend unavailable (%s) – falling back to CPU", exc)
+
+    def _warm_up_network(self) -> None:
+        """Run one dummy forward pass so lazy backend setup happens at init.
+
+        The first ``net.forward`` call pays for kernel selection and memory
+        allocation; doing it here keeps the first real detection from being a
+        multi-second outlier.
+        """
+
+        try:
+            warm_up_blob = np.zeros((1, 3, 320, 320), np.float32)
+            self.net.setInput(warm_up_blob)
+            self.net.forward(self.output_layers)
+        except cv2.error as exc:  # pragma: no cover - backend specific
+            self.logger.warning("YOLO warm-up pass failed: %s", exc)
+
     # ------------------------------------------------------------------
     # Perception helpers
     # ------------------------------------------------------------------
 
-    def detect_objects(self, image: np.ndarray) -> List[Detection]:
-        """Run YOLO detection on the provided frame with simple frame skipping."""
+    def detect_objects(self, image: np.ndarray, small: Optional[np.ndarray] = None) -> List[Detection]:
+        """Run YOLO detection on the provided frame with simple frame skipping.
+
+        ``small`` may carry an already downscaled copy of ``image`` (shared
+        with the lane pipeline) so both consumers pay for a single resize of
+        the source frame.  Returned coordinates are always in ``image`` space.
+        """
 
         self.frame_count += 1
         if self.frame_count % self.detection_interval != 0 and self.last_detections:
             return self.last_detections
 
         height, width = image.shape[:2]
-
-        blob = cv2.dnn.blobFromImage(image, 1 / 255.0, (320, 320), swapRB=True, crop=False)
-        self.net.setInput(blob)
+        if small is not None:
+            source = small
+            scale_x = width / small.shape[1]
+            scale_y = height / small.shape[0]
+        else:
+            source = image
+            scale_x = scale_y = 1.0
+
+        if self.trt_backend is not None:
+            class_array, confidence_array, box_array = self.trt_backend.infer(image)
+            road = self._is_road_class[class_array] & (confidence_array > 0.4)
+            detections = [
+                Detection(
+                    label=self.class_labels[int(class_id)],
+                    box=(int(x1), int(y1), int(x2), int(y2)),
+                    confidence=float(confidence),
+                    center=(int((x1 + x2) // 2), int((y1 + y2) // 2)),
+                )
+                for class_id, confidence, (x1, y1, x2, y2) in zip(
+                    class_array[road], confidence_array[road], box_array[road]
+                )
+            ]
+            self.last_detections = detections
+            return detections
+
+        if self.detection_model is not None:
+            # Fused blob + forward + NMS inside OpenCV; only the road-class
+            # filter and dataclass construction remain in Python.
+            class_array, confidence_array, box_array = self.detection_model.detect(
+                source, confThreshold=0.4, nmsThreshold=0.3
+            )
+            class_array = np.asarray(class_array).reshape(-1)
+            confidence_array = np.asarray(confidence_array).reshape(-1)
+            box_array = np.asarray(box_array).reshape(-1, 4).astype(np.float32)
+            box_array *= np.array([scale_x, scale_y, scale_x, scale_y], np.float32)
+
+            road = self._is_road_class[class_array]
+            detections = [
+                Detection(
+                    label=self.class_labels[int(class_id)],
+                    box=(int(x), int(y), int(x + w), int(y + h)),
+                    confidence=float(confidence),
+                    center=(int(x + w // 2), int(y + h // 2)),
+                )
+                for class_id, confidence, (x, y, w, h) in zip(
+                    class_array[road], confidence_array[road], box_array[road]
+                )
+            ]
+            self.last_detections = detections
+            return detections
+
+        cv2.resize(source, (320, 320), dst=self._resize_buffer)
+        # Build the blob by hand straight into the persistent scratch:
+        # channel swap (BGR -> RGB) via the reversed view, HWC -> CHW via
+        # transpose, and the 1/255 scale written with ``out=``, replacing
+        # the fresh tensor ``blobFromImage`` allocates per call.
+        np.multiply(
+            self._resize_buffer[:, :, ::-1].transpose(2, 0, 1),
+            np.float32(1 / 255.0),
+            out=self._blob_scratch[0],
+        )
+        self.net.setInput(self._blob_scratch)
         outputs = self.net.forward(self.output_layers)
 
-        boxes: List[List[int]] = []
-        confidences: List[float] = []
-        class_ids: List[int] = []
-
-        for output in outputs:
-            for detection in output:
-                scores = detection[5:]
-                class_id = int(np.argmax(scores))
-                confidence = float(scores[class_id])
-
-                if confidence <= 0.4 or class_id not in self.road_class_ids:
-                    continue
-
-                center_x = int(detection[0] * width)
-                center_y = int(detection[1] * height)
-                box_width = int(detection[2] * width)
-                box_height = int(detection[3] * height)
-
-                x = int(center_x - box_width / 2)
-                y = int(center_y - box_height / 2)
+        # Decode every YOLO head in one pass through the compiled kernel
+        # instead of iterating thousands of anchor rows in Python.
+        predictions = np.concatenate([output.reshape(-1, output.shape[-1]) for output in outputs], axis=0)
 
-                boxes.append([x, y, box_width, box_height])
-                confidences.append(confidence)
-                class_ids.append(class_id)
+        box_array, confidence_array, class_array = _decode_predictions(
+            np.ascontiguousarray(predictions, dtype=np.float32), self._road_idx, 0.4, width, height
+        )
+        boxes = box_array.tolist()
+        confidences = confidence_array.astype(float).tolist()
+        class_ids = class_array.tolist()
 
         detections: List[Detection] = []
         if boxes:
@@ -221,40 +544,51 @@ class LaneNavigationSystem:
         self.last_detections = detections
         return detections
 
-    def detect_lanes(self, image: np.ndarray) -> Tuple[Optional[np.ndarray], np.ndarray]:
-        """Perform a fast lane search using Canny edges and the Hough transform."""
+    def detect_lanes(self, image: np.ndarray, small: Optional[np.ndarray] = None) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        """Perform a fast lane search using Canny edges and the Hough transform.
+
+        The whole search runs at 320x240: upscaling the binary edge image back
+        to full resolution only blurred the edges and doubled memory traffic,
+        so instead the detected line coordinates are scaled up afterwards.
+        Canny applies its own smoothing, which makes the previous Gaussian
+        blur pass redundant.  ``small`` may carry the shared 320x240 downscale
+        of the frame so the resize is not repeated here.
+        """
 
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (3, 3), 0)
-        small_img = cv2.resize(blur, (320, 240))
-        edges = cv2.Canny(small_img, 50, 150)
-        edges = cv2.resize(edges, (image.shape[1], image.shape[0]))
+        # Lanes follow the same stride as YOLO: between detection frames the
+        # cached result is returned, so Canny and Hough run on one frame in
+        # ``detection_interval``.
+        if self.frame_count % self.detection_interval != 0 and self.last_lane_lines is not None:
+            return self.last_lane_lines, self.last_roi_vertices
 
         height, width = image.shape[:2]
-        mask = np.zeros_like(edges)
-        polygon = np.array(
-            [
-                [
-                    (0, height),
-                    (width // 4, height // 2),
-                    (3 * width // 4, height // 2),
-                    (width, height),
-                ]
-            ],
-            np.int32,
-        )
-        cv2.fillPoly(mask, polygon, 255)
-        masked_edges = cv2.bitwise_and(edges, mask)
+
+        if small is None:
+            small = cv2.resize(image, (320, 240), dst=self._lane_small)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=self._lane_gray)
+        edges = cv2.Canny(gray, 50, 150, self._lane_edges)
+
+        cv2.bitwise_and(edges, self._roi_mask, dst=edges)
 
         lines = cv2.HoughLinesP(
-            masked_edges,
+            edges,
             rho=1,
             theta=np.pi / 180,
             threshold=20,
             minLineLength=25,
             maxLineGap=30,
         )
-        return lines, polygon[0]
+
+        # Map the low-resolution results back to frame coordinates with one
+        # vectorized multiply.
+        point_scale = np.array([width / 320.0, height / 240.0], np.float32)
+        if lines is not None:
+            lines = (lines.astype(np.float32) * np.tile(point_scale, 2)).astype(np.int32)
+        roi_vertices = (self._roi_polygon[0].astype(np.float32) * point_scale).astype(np.int32)
+
+        self.last_lane_lines = lines
+        self.last_roi_vertices = roi_vertices
+        return lines, roi_vertices
 
     # ------------------------------------------------------------------
     # Scene analysis
@@ -278,18 +612,16 @@ class LaneNavigationSystem:
                 analysis.traffic_controls += 1
 
         if lane_lines is not None and len(lane_lines) > 0:
-            left_count = 0
-            right_count = 0
-
-            for line in lane_lines:
-                for x1, y1, x2, y2 in line:
-                    if x2 == x1:
-                        continue
-                    slope = (y2 - y1) / (x2 - x1)
-                    if slope > 0.1:
-                        left_count += 1
-                    elif slope < -0.1:
-                        right_count += 1
+            # ``HoughLinesP`` returns an (N, 1, 4) array, so the slope
+            # classification is a single vectorized divide instead of a
+            # per-line Python loop.
+            segments = lane_lines.reshape(-1, 4)
+            dx = segments[:, 2] - segments[:, 0]
+            dy = segments[:, 3] - segments[:, 1]
+            sloped = dx != 0
+            slopes = dy[sloped] / dx[sloped]
+            left_count = int(np.count_nonzero(slopes > 0.1))
+            right_count = int(np.count_nonzero(slopes < -0.1))
 
             if left_count >= 1 and right_count >= 1:
                 analysis.lane_status = "CLEAR_LANES"
@@ -331,55 +663,155 @@ class LaneNavigationSystem:
         roi_vertices: np.ndarray,
         fps: float,
     ) -> np.ndarray:
-        """Overlay detections, lanes and a status panel on the frame."""
+        """Overlay detections, lanes and a status panel on the frame.
+
+        Drawing happens in place on ``image``: the run loop does not reuse
+        the raw frame afterwards, so the previous full-frame copy was a
+        900KB memcpy per frame for nothing.
+        """
 
-        result = image.copy()
+        result = image
         height, width = image.shape[:2]
 
         cv2.polylines(result, [roi_vertices], True, (0, 255, 0), 1)
 
         if lane_lines is not None:
-            for line in lane_lines[:8]:
-                for x1, y1, x2, y2 in line:
-                    cv2.line(result, (x1, y1), (x2, y2), (0, 0, 255), 2)
-
-        for obj in list(detections)[:10]:
+            # All lane segments go out in one polylines call instead of a
+            # cv2.line round trip per segment.
+            segments = lane_lines[:8].reshape(-1, 2, 2).astype(np.int32)
+            cv2.polylines(result, segments, False, (0, 0, 255), 2)
+
+        # Boxes are bucketed by colour so each colour is a single batched
+        # polylines call rather than one rectangle per detection.
+        buckets: Dict[Tuple[int, int, int], List[np.ndarray]] = {}
+        labels: List[Tuple[str, int, int, Tuple[int, int, int]]] = []
+        for obj in islice(detections, 10):
             x1, y1, x2, y2 = obj.box
             colour = self.ROAD_CLASS_COLOURS.get(obj.label, (255, 255, 255))
-            cv2.rectangle(result, (x1, y1), (x2, y2), colour, 1)
-            cv2.putText(result, obj.label, (x1, y1 - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.4, colour, 1)
+            buckets.setdefault(colour, []).append(
+                np.array([[x1, y1], [x2, y1], [x2, y2], [x1, y2]], np.int32)
+            )
+            labels.append((obj.label, x1, y1, colour))
+        for colour, polygons in buckets.items():
+            cv2.polylines(result, polygons, True, colour, 1)
+        for label, x1, y1, colour in labels:
+            self._blit_text(result, label, (x1, y1 - 5), 0.4, colour)
 
         self._draw_info_panel(result, analysis, fps, width)
         return result
 
+    def _blit_text(
+        self,
+        image: np.ndarray,
+        text: str,
+        org: Tuple[int, int],
+        scale: float,
+        colour: Tuple[int, int, int],
+        thickness: int = 1,
+    ) -> None:
+        """Paste ``text`` from the tile cache, rendering it on first use."""
+
+        key = (text, scale, colour, thickness)
+        entry = self._text_cache.get(key)
+        if entry is None:
+            (text_w, text_h), baseline = cv2.getTextSize(
+                text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness
+            )
+            tile = np.zeros((text_h + baseline, max(text_w, 1), 3), np.uint8)
+            cv2.putText(tile, text, (0, text_h), cv2.FONT_HERSHEY_SIMPLEX, scale, colour, thickness)
+            entry = (tile, tile.any(axis=2, keepdims=True), text_h)
+            self._text_cache[key] = entry
+            if len(self._text_cache) > 256:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+
+        tile, mask, text_h = entry
+        x, y = org
+        y0, x0 = y - text_h, x
+        y1, x1 = y0 + tile.shape[0], x0 + tile.shape[1]
+        if y0 < 0 or x0 < 0 or y1 > image.shape[0] or x1 > image.shape[1]:
+            # Clipped placements are rare; let putText handle them.
+            cv2.putText(image, text, org, cv2.FONT_HERSHEY_SIMPLEX, scale, colour, thickness)
+            return
+        np.copyto(image[y0:y1, x0:x1], tile, where=mask)
+
     def _draw_info_panel(self, image: np.ndarray, analysis: SceneAnalysis, fps: float, width: int) -> None:
         """Render a compact information overlay in the top left corner."""
 
-        overlay = image.copy()
-        cv2.rectangle(overlay, (0, 0), (280, 80), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, image, 0.3, 0, image)
+        # The overlay rectangle is solid black, so the alpha blend reduces
+        # to scaling the 280x80 panel region in place – no full-frame copy.
+        panel = image[0:80, 0:280]
+        cv2.addWeighted(panel, 0.3, panel, 0.0, 0, dst=panel)
 
         safety_colour = (0, 255, 0) if analysis.safety_status == "SAFE" else (0, 165, 255)
         action_colour = (0, 255, 0) if analysis.recommended_action == "MAINTAIN_LANE" else (0, 165, 255)
 
         y_pos = 15
-        cv2.putText(image, f"FPS: {fps:.1f}", (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        self._blit_text(image, f"FPS: {fps:.1f}", (10, y_pos), 0.4, (255, 255, 255))
         y_pos += 15
-        cv2.putText(image, f"Cars: {analysis.cars_detected}", (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        self._blit_text(image, f"Cars: {analysis.cars_detected}", (10, y_pos), 0.4, (255, 255, 255))
         y_pos += 15
-        cv2.putText(image, f"Lanes: {analysis.lane_status}", (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        self._blit_text(image, f"Lanes: {analysis.lane_status}", (10, y_pos), 0.4, (255, 255, 255))
         y_pos += 15
-        cv2.putText(image, f"Action: {analysis.recommended_action}", (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.5, action_colour, 1)
+        self._blit_text(image, f"Action: {analysis.recommended_action}", (10, y_pos), 0.5, action_colour)
 
         if "OVERTAKE" in analysis.recommended_action:
-            cv2.putText(image, ">>>", (width - 50, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+            self._blit_text(image, ">>>", (width - 50, 30), 0.7, (0, 255, 255), 2)
         elif "STOP" in analysis.recommended_action:
-            cv2.putText(image, "!", (width - 30, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+            self._blit_text(image, "!", (width - 30, 30), 0.7, (0, 0, 255), 2)
 
     # ------------------------------------------------------------------
     # Convenience runner
     # ------------------------------------------------------------------
 
+    def _capture_frames(self, cap: cv2.VideoCapture) -> None:
+        """Continuously read frames, keeping only the most recent one.
+
+        Overwriting an unconsumed frame counts as a drop; drops are reported
+        once per second so slowdowns in the processing loop stay visible.
+        """
+
+        last_report = time.time()
+        while self._capture_running:
+            # grab() only dequeues the driver buffer; the YUV->BGR decode in
+            # retrieve() is paid solely for frames the consumer will see, so
+            # frames dropped under load cost almost nothing.
+            if not cap.grab():
+                self._capture_running = False
+                break
+
+            with self._frame_lock:
+                consumed = self._latest_frame is None
+            if not consumed:
+                self._dropped_frames += 1
+            else:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    self._capture_running = False
+                    break
+                with self._frame_lock:
+                    self._latest_frame = frame
+
+            now = time.time()
+            if now - last_report >= 1.0 and self._dropped_frames:
+                self.logger.debug("Dropped %s stale frames in the last second", self._dropped_frames)
+                self._dropped_frames = 0
+                last_report = now
+
+    def _display_worker(self) -> None:
+        """Show annotated frames until a ``None`` sentinel or 'q' arrives."""
+
+        while True:
+            frame = self._display_queue.get()
+            if frame is None:
+                break
+            cv2.imshow("Fast YOLO Navigation", frame)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                self._quit_event.set()
+                break
+        cv2.destroyAllWindows()
+
     def run(self, camera_index: int = 0) -> None:
         """Provide a CLI-friendly loop that mirrors the legacy script output."""
 
@@ -398,16 +830,37 @@ class LaneNavigationSystem:
         start_time = time.time()
         fps = 0.0
 
+        self._capture_running = True
+        self._latest_frame = None
+        grabber = threading.Thread(target=self._capture_frames, args=(cap,), daemon=True)
+        grabber.start()
+
+        display_thread = None
+        if self.display_enabled:
+            self._quit_event.clear()
+            display_thread = threading.Thread(target=self._display_worker, daemon=True)
+            display_thread.start()
+
         try:
             while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
+                with self._frame_lock:
+                    frame = self._latest_frame
+                    self._latest_frame = None
+
+                if frame is None:
+                    if not self._capture_running:
+                        break
+                    time.sleep(0.001)
+                    continue
 
                 frame_count += 1
 
-                detections = self.detect_objects(frame)
-                lane_lines, roi_vertices = self.detect_lanes(frame)
+                # One shared downscale feeds both perception stages.
+                small = cv2.resize(frame, (320, 240))
+                detection_future = self._pool.submit(self.detect_objects, frame, small)
+                lane_future = self._pool.submit(self.detect_lanes, frame, small)
+                detections = detection_future.result()
+                lane_lines, roi_vertices = lane_future.result()
                 analysis = self.analyse_scene(frame, detections, lane_lines)
 
                 if frame_count % 15 == 0:
@@ -415,8 +868,21 @@ class LaneNavigationSystem:
                     fps = 15 / (current_time - start_time)
                     start_time = current_time
 
-                result_frame = self.draw_results(frame, analysis, detections, lane_lines, roi_vertices, fps)
-                cv2.imshow("Fast YOLO Navigation", result_frame)
+                if self.display_enabled:
+                    result_frame = self.draw_results(frame, analysis, detections, lane_lines, roi_vertices, fps)
+                    # Preview frames are droppable: replace a stale queued
+                    # frame rather than wait for the display thread.
+                    try:
+                        self._display_queue.put_nowait(result_frame)
+                    except queue.Full:
+                        try:
+                            self._display_queue.get_nowait()
+                        except queue.Empty:
+                            pass
+                        try:
+                            self._display_queue.put_nowait(result_frame)
+                        except queue.Full:
+                            pass
 
                 if frame_count % 45 == 0:
                     print(
@@ -424,13 +890,17 @@ class LaneNavigationSystem:
                         f"Action: {analysis.recommended_action}"
                     )
 
-                if cv2.waitKey(1) & 0xFF == ord("q"):
+                if self._quit_event.is_set():
                     break
         except KeyboardInterrupt:
             print("Stopped by user")
         finally:
+            self._capture_running = False
+            grabber.join(timeout=1.0)
+            if display_thread is not None:
+                self._display_queue.put(None)
+                display_thread.join(timeout=1.0)
             cap.release()
-            cv2.destroyAllWindows()
             print("Navigation stopped")
 
 
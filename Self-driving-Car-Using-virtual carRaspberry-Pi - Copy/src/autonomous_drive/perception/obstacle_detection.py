@@ -8,19 +8,31 @@ that perception can be reused from tests or higher level applications.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple
 
 import cv2
+import gc
+import logging
 import numpy as np
+import queue
+import threading
 import time
 
+import torch
 from ultralytics import YOLO
 
 from autonomous_drive.control.motor_controller import MotorController
+from autonomous_drive.perception.ort_backend import YoloOrtRunner
 from autonomous_drive.utils.logger import get_logger
 
+try:  # pragma: no cover - numba is an optional accelerator
+    from numba import njit
+except ImportError:  # pragma: no cover - running without numba
+    njit = None
+
 # ---------------------------------------------------------------------------
 # Logging helper used across the module
 # ---------------------------------------------------------------------------
@@ -28,21 +40,113 @@ from autonomous_drive.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _as_array(values) -> np.ndarray:
+    """Return detection data as a NumPy array.
+
+    Torch tensors from ultralytics are moved to host memory first; the
+    ONNXRuntime backend already hands back plain arrays.
+    """
+
+    to_cpu = getattr(values, "cpu", None)
+    if to_cpu is not None:
+        values = to_cpu()
+    return np.asarray(values)
+
+
+def _batch_distances(widths, cls_ids, widths_table, focal):
+    """Distances in metres for a batch of boxes from the class-width table.
+
+    Widths over 50 m (or degenerate boxes) come back as ``inf``, matching
+    :meth:`DistanceEstimator.calculate`.
+    """
+
+    distances = np.where(
+        widths > 0,
+        (widths_table[cls_ids] * focal) / np.maximum(widths, 1),
+        np.inf,
+    )
+    return np.where(distances <= 50, distances.round(1), np.inf)
+
+
+if njit is not None:  # pragma: no cover - exercised only with numba installed
+
+    @njit(cache=True, fastmath=True)
+    def _batch_distances(widths, cls_ids, widths_table, focal):  # noqa: F811
+        """JIT-compiled distance loop; signature matches the NumPy fallback."""
+
+        out = np.empty(widths.shape[0], np.float64)
+        for i in range(widths.shape[0]):
+            width = widths[i]
+            if width <= 0:
+                out[i] = np.inf
+                continue
+            distance = (widths_table[cls_ids[i]] * focal) / width
+            out[i] = np.round(distance, 1) if distance <= 50 else np.inf
+        return out
+
+
 # ---------------------------------------------------------------------------
 # Action logging utilities
 # ---------------------------------------------------------------------------
 
 
+_log_queue: "queue.Queue[str]" = queue.Queue()
+
+
+class _LogWriter(threading.Thread):
+    """Drain queued action log lines into ``car_actions.log``.
+
+    The file is opened once in append mode and writes are batched: the
+    thread blocks for the first pending line, sweeps up everything else
+    already queued and flushes the batch in one go.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+
+    def run(self) -> None:
+        with Path("car_actions.log").open("a", encoding="utf-8") as handle:
+            while True:
+                lines = [_log_queue.get()]
+                while True:
+                    try:
+                        lines.append(_log_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                handle.writelines(lines)
+                handle.flush()
+
+
+_log_writer: Optional[_LogWriter] = None
+
+# The log timestamp has whole-second resolution, so the formatted string is
+# cached and only rebuilt when the second changes.
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
 def log_action(action: str, speed: int) -> None:
-    """Persist a human readable action log with timestamps.
+    """Queue a human readable action log line with a timestamp.
 
-    The original implementation wrote to ``car_actions.log`` and the behaviour is
-    preserved to ensure downstream tooling keeps working.
+    The original implementation opened ``car_actions.log`` on every motor
+    command; the file name and line format are preserved, but the write now
+    happens on a background thread so the decision path never blocks on
+    file I/O.
     """
 
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    with Path("car_actions.log").open("a", encoding="utf-8") as handle:
-        handle.write(f"{timestamp} - {action} at {speed} km/h\n")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    global _log_writer, _last_ts_sec, _last_ts_str
+    if _log_writer is None:
+        _log_writer = _LogWriter()
+        _log_writer.start()
+
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _last_ts_sec = now
+    _log_queue.put(f"{_last_ts_str} - {action} at {speed} km/h\n")
 
 
 # ---------------------------------------------------------------------------
@@ -90,10 +194,33 @@ class MotorActions:
 class TrafficLightDetector:
     """Specialised detector that extracts light colour from YOLO boxes."""
 
+    #: Minimum mask population before a colour verdict is trusted.
+    MIN_COLOUR_PIXELS = 20
+
     def __init__(self) -> None:
         self.traffic_light_class_id = 9
         self.last_detection_time = 0.0
         self.current_light_state = "UNKNOWN"
+        self._hsv_lut = self._build_hsv_lut()
+
+    @staticmethod
+    def _build_hsv_lut() -> np.ndarray:
+        """Build the quantized HSV -> colour-label table.
+
+        Labels are 0/1/2/3 for none/red/yellow/green.  Hue is binned by 10
+        and saturation/value by 16, so the table is a 4 KB ``(18, 16, 16)``
+        array; each bin is classified by its centre value.
+        """
+        hue = np.arange(18, dtype=np.int32)[:, None, None] * 10 + 5
+        sat = np.arange(16, dtype=np.int32)[None, :, None] * 16 + 8
+        val = np.arange(16, dtype=np.int32)[None, None, :] * 16 + 8
+
+        lut = np.zeros((18, 16, 16), np.uint8)
+        sv_ok = (sat >= 100) & (val >= 100)
+        lut[sv_ok & (sat >= 150) & ((hue <= 10) | (hue >= 170))] = 1
+        lut[(hue >= 20) & (hue <= 30) & (sat >= 150) & (val >= 150)] = 2
+        lut[sv_ok & (hue >= 45) & (hue <= 85)] = 3
+        return lut
 
     def detect(self, frame: np.ndarray, results) -> List[Dict[str, object]]:
         traffic_lights: List[Dict[str, object]] = []
@@ -122,15 +249,19 @@ class TrafficLightDetector:
             return "UNKNOWN"
 
         hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
-        red_ranges = [((0, 150, 100), (10, 255, 255)), ((170, 150, 100), (180, 255, 255))]
-        yellow_range = ((20, 150, 150), (30, 255, 255))
-        green_range = ((45, 100, 100), (85, 255, 255))
 
-        red_pixels = sum(cv2.countNonZero(cv2.inRange(hsv, lower, upper)) for lower, upper in red_ranges)
-        yellow_pixels = cv2.countNonZero(cv2.inRange(hsv, *yellow_range))
-        green_pixels = cv2.countNonZero(cv2.inRange(hsv, *green_range))
+        # A single gather through the quantized LUT labels every pixel at
+        # once; one bincount then yields all three colour populations, so
+        # the ROI is read exactly once.
+        labels = self._hsv_lut[hsv[..., 0] // 10, hsv[..., 1] // 16, hsv[..., 2] // 16]
+        counts = np.bincount(labels.ravel(), minlength=4)
+        red_pixels, yellow_pixels, green_pixels = (
+            int(counts[1]),
+            int(counts[2]),
+            int(counts[3]),
+        )
 
-        min_pixels = 20
+        min_pixels = self.MIN_COLOUR_PIXELS
         if red_pixels > max(yellow_pixels, green_pixels) and red_pixels > min_pixels:
             return "RED"
         if yellow_pixels > max(green_pixels, red_pixels) and yellow_pixels > min_pixels:
@@ -167,16 +298,61 @@ class DistanceEstimator:
         return round(distance, 1) if distance <= 50 else float("inf")
 
 
+#: Structure-of-arrays layout for per-frame detections.  One contiguous
+#: record array replaces the former dict-of-dicts, so tracking maths runs
+#: as whole-column NumPy operations with no per-object allocation.
+TRACK_DTYPE = np.dtype(
+    [
+        ("cx", "i4"),
+        ("cy", "i4"),
+        ("cls", "i4"),
+        ("x1", "i4"),
+        ("y1", "i4"),
+        ("x2", "i4"),
+        ("y2", "i4"),
+        ("w", "i4"),
+    ]
+)
+
+# HUD drawing constants hoisted to module scope so every render reuses the
+# same objects instead of rebuilding colour dicts and font lookups per call.
+_HUD_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_LIGHT_COLOURS = {"RED": (0, 0, 255), "YELLOW": (0, 255, 255), "GREEN": (0, 255, 0)}
+_STATUS_COLOURS = {
+    "STOP": (0, 0, 255),
+    "SLOW DOWN": (0, 165, 255),
+    "FORWARD": (0, 255, 0),
+    "LEFT": (255, 165, 0),
+    "RIGHT": (255, 165, 0),
+}
+
+
 class SpeedEstimator:
     """Track per-object movement between frames to approximate speed."""
 
+    #: Maximum centroid displacement (px) for a detection to extend a track.
+    MATCH_GATE_PX = 50
+
     def __init__(self) -> None:
-        self.previous_positions: Dict[str, Dict[str, float]] = {}
+        self._prev = np.empty(0, dtype=TRACK_DTYPE)
+        self._prev_ids = np.empty(0, dtype=np.int64)
+        self._next_id = 0
         self.previous_time = time.time()
         self.vehicle_speed = 0
-        self.speed_history: List[int] = []
+        # maxlen gives O(1) append-with-eviction; no pop(0) shuffling.
+        self.speed_history: deque = deque(maxlen=10)
+
+    def estimate(self, objects: np.ndarray, frame_width: int) -> Dict[str, float]:
+        """Estimate km/h speeds from a :data:`TRACK_DTYPE` record array.
+
+        Detections are matched to the previous frame by nearest centroid of
+        the same class, gated at :data:`MATCH_GATE_PX`.  Matched detections
+        keep their integer track id, so the same physical object reports
+        under the same key frame after frame; unmatched detections open a
+        new track and unmatched old tracks are dropped immediately, which
+        bounds the working set at one frame's worth of objects.
+        """
 
-    def estimate(self, current_objects: Dict[str, Dict[str, object]], frame_width: int) -> Dict[str, float]:
         current_time = time.time()
         time_elapsed = current_time - self.previous_time
         speeds: Dict[str, float] = {}
@@ -184,22 +360,39 @@ class SpeedEstimator:
         if time_elapsed < 0.1:
             return speeds
 
-        for obj_id, info in current_objects.items():
-            if obj_id not in self.previous_positions:
-                self.previous_positions[obj_id] = info
-                continue
-
-            prev = self.previous_positions[obj_id]
-            pixel_distance = np.hypot(info["center_x"] - prev["center_x"], info["center_y"] - prev["center_y"])
-            meters_per_pixel = 2.3 / frame_width
-            speed_mps = (pixel_distance * meters_per_pixel) / time_elapsed
-            speed_kmh = speed_mps * 3.6
-
-            if 1.0 < speed_kmh < 100:
-                speeds[obj_id] = round(speed_kmh, 1)
-
-            self.previous_positions[obj_id] = info
-
+        count = len(objects)
+        ids = np.full(count, -1, dtype=np.int64)
+        if count and len(self._prev):
+            prev_c = np.stack((self._prev["cx"], self._prev["cy"]), axis=-1).astype(np.float64)
+            new_c = np.stack((objects["cx"], objects["cy"]), axis=-1).astype(np.float64)
+            distances = np.linalg.norm(prev_c[:, None, :] - new_c[None, :, :], axis=-1)
+            distances[self._prev["cls"][:, None] != objects["cls"][None, :]] = np.inf
+
+            # Greedy one-to-one assignment: repeatedly take the globally
+            # closest in-gate pair.  With ~10 objects per frame the loop is
+            # negligible next to the vectorised matrix build.
+            factor = (2.3 / frame_width) / time_elapsed * 3.6
+            while True:
+                prev_row, new_col = divmod(int(distances.argmin()), count)
+                displacement = distances[prev_row, new_col]
+                if not np.isfinite(displacement) or displacement > self.MATCH_GATE_PX:
+                    break
+                track_id = int(self._prev_ids[prev_row])
+                ids[new_col] = track_id
+                speed_kmh = displacement * factor
+                if 1.0 < speed_kmh < 100.0:
+                    speeds[f"object_{track_id}"] = round(float(speed_kmh), 1)
+                distances[prev_row, :] = np.inf
+                distances[:, new_col] = np.inf
+
+        fresh = ids < 0
+        new_tracks = int(fresh.sum())
+        if new_tracks:
+            ids[fresh] = np.arange(self._next_id, self._next_id + new_tracks)
+            self._next_id += new_tracks
+
+        self._prev = objects.copy()
+        self._prev_ids = ids
         self.previous_time = current_time
         return speeds
 
@@ -217,24 +410,50 @@ class SpeedEstimator:
             self.vehicle_speed = min(30, self.vehicle_speed)
 
         self.speed_history.append(self.vehicle_speed)
-        if len(self.speed_history) > 10:
-            self.speed_history.pop(0)
         return self.vehicle_speed
 
 
 class EnvironmentDetector:
     """Estimate coarse environmental conditions from the current frame."""
 
+    # Lighting and weather change on a timescale of seconds, so the image
+    # statistics only need refreshing every few frames.
+    REFRESH_INTERVAL = 15
+    #: A quick-probe brightness shift below this keeps the cached verdict.
+    BRIGHTNESS_DELTA = 0.05
+
     def __init__(self) -> None:
         self.current_conditions = {
             "time_of_day": "DAY",
             "weather": "CLEAR",
             "brightness": 0.5,
         }
+        self._frames_since_refresh = self.REFRESH_INTERVAL
+        self._last_brightness = -1.0
 
     def detect(self, frame: np.ndarray) -> Dict[str, object]:
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        brightness = float(np.mean(gray) / 255.0)
+        self._frames_since_refresh += 1
+        if self._frames_since_refresh < self.REFRESH_INTERVAL:
+            return dict(self.current_conditions)
+        self._frames_since_refresh = 0
+
+        # Cheap probe on a ~32x24 sample: if overall brightness has barely
+        # moved since the last full pass, the cached classification still
+        # holds and the full statistics are skipped entirely.
+        quick_brightness = float(frame[::20, ::20].mean()) / 255.0
+        if abs(quick_brightness - self._last_brightness) < self.BRIGHTNESS_DELTA:
+            return dict(self.current_conditions)
+        self._last_brightness = quick_brightness
+
+        # Brightness and variance on an 8x-decimated view: the statistics
+        # barely change but the bytes traversed drop by ~64x.  OpenCV's
+        # meanStdDev gives both figures from one SIMD pass over the buffer;
+        # luminance is the BT.601 weighting of the per-channel means.
+        small = np.ascontiguousarray(frame[::8, ::8])
+        mean_bgr, std_bgr = cv2.meanStdDev(small)
+        brightness = float(
+            0.114 * mean_bgr[0, 0] + 0.587 * mean_bgr[1, 0] + 0.299 * mean_bgr[2, 0]
+        ) / 255.0
         self.current_conditions["brightness"] = brightness
 
         if brightness < 0.3:
@@ -244,7 +463,7 @@ class EnvironmentDetector:
         else:
             self.current_conditions["time_of_day"] = "DAY"
 
-        colour_variance = float(np.var(frame) / (255 ** 2))
+        colour_variance = float((std_bgr ** 2).mean() / (255 ** 2))
         if colour_variance < 0.05:
             self.current_conditions["weather"] = "FOGGY"
         elif brightness > 0.8:
@@ -260,6 +479,24 @@ class EnvironmentDetector:
 class CarController:
     """Decision making layer that transforms perception into motor commands."""
 
+    #: Static decisions keyed by (light state, distance bucket), replacing
+    #: the deep if/elif ladder with one dict probe on the steady-state
+    #: path.  "NONE" stands for no visible light; templates with ``%s``
+    #: are filled with the closest object type.  RED, YELLOW and the
+    #: no-light avoidance swerve stay as branches because they depend on
+    #: more than state and distance.
+    _DECISION_TABLE: Dict[Tuple[str, int], Tuple[int, str, str, bool]] = {
+        ("GREEN", 0): (0, "STOP", "Green light – obstacle too close", False),
+        ("GREEN", 1): (0, "STOP", "Green light – obstacle too close", False),
+        ("GREEN", 2): (25, "SLOW DOWN", "Green light – obstacle ahead", False),
+        ("GREEN", 3): (25, "SLOW DOWN", "Green light – obstacle ahead", False),
+        ("GREEN", 4): (40, "FORWARD", "Green light – clear path", False),
+        ("NONE", 0): (0, "STOP", "Emergency stop: %s too close", True),
+        ("NONE", 2): (20, "SLOW DOWN", "Approaching %s", True),
+        ("NONE", 3): (50, "FORWARD", "Clear path – normal driving", False),
+        ("NONE", 4): (50, "FORWARD", "Clear path – normal driving", False),
+    }
+
     def __init__(self, motor_actions: Optional[MotorActions] = None) -> None:
         self.motor_actions = motor_actions or MotorActions()
         self.traffic_light_state = "UNKNOWN"
@@ -300,37 +537,50 @@ class CarController:
         else:
             self.traffic_light_state = "UNKNOWN"
 
-        if self.traffic_light_state == "RED":
+        state = self.traffic_light_state
+        if state == "RED":
             base_speed, action, reason = 0, "STOP", "Red traffic light detected"
-        elif self.traffic_light_state == "YELLOW":
+        elif state == "YELLOW":
             if self.last_action == "FORWARD" and closest_distance > 5.0:
                 base_speed, action, reason = 20, "SLOW DOWN", "Yellow light – proceeding with caution"
             else:
                 base_speed, action, reason = 0, "STOP", "Yellow light – preparing to stop"
-        elif self.traffic_light_state == "GREEN":
-            if closest_distance > 8.0:
-                base_speed, action, reason = 40, "FORWARD", "Green light – clear path"
-            elif closest_distance > 4.0:
-                base_speed, action, reason = 25, "SLOW DOWN", "Green light – obstacle ahead"
-            else:
-                base_speed, action, reason = 0, "STOP", "Green light – obstacle too close"
-        elif closest_distance <= 2.0:
-            base_speed, action, reason = 0, "STOP", f"Emergency stop: {closest_type} too close"
-        elif closest_distance <= 4.0:
-            base_speed = 15
-            if any(speed > 10 for speed in object_speeds.values()):
-                action, reason = "STOP", f"Moving object approaching: {closest_type}"
-            else:
-                action = "LEFT" if self.last_action != "LEFT" else "RIGHT"
-                reason = f"Avoiding {closest_type}"
-        elif closest_distance <= 6.0:
-            base_speed, action, reason = 20, "SLOW DOWN", f"Approaching {closest_type}"
         else:
-            base_speed, action, reason = 50, "FORWARD", "Clear path – normal driving"
+            bucket = self._distance_bucket(closest_distance)
+            entry = self._DECISION_TABLE.get(
+                (state if state == "GREEN" else "NONE", bucket)
+            )
+            if entry is not None:
+                base_speed, action, template, wants_type = entry
+                reason = template % closest_type if wants_type else template
+            else:
+                # Avoidance at 2-4 m with no light: a moving object forces
+                # a stop, otherwise the swerve direction alternates with
+                # the previous action.
+                base_speed = 15
+                if any(speed > 10 for speed in object_speeds.values()):
+                    action, reason = "STOP", f"Moving object approaching: {closest_type}"
+                else:
+                    action = "LEFT" if self.last_action != "LEFT" else "RIGHT"
+                    reason = f"Avoiding {closest_type}"
 
         final_speed = self._adjust_speed(base_speed)
         return action, final_speed, reason
 
+    @staticmethod
+    def _distance_bucket(distance: float) -> int:
+        """Map a distance in metres onto the 2/4/6/8 m decision buckets."""
+
+        if distance <= 2.0:
+            return 0
+        if distance <= 4.0:
+            return 1
+        if distance <= 6.0:
+            return 2
+        if distance <= 8.0:
+            return 3
+        return 4
+
     def execute(self, action: str, speed: int, reason: str) -> Tuple[str, int]:
         logger.info("[DECISION] %s at %s km/h – %s", action, speed, reason)
 
@@ -350,6 +600,158 @@ class CarController:
         return action, speed
 
 
+# ---------------------------------------------------------------------------
+# Capture/inference pipeline helpers
+# ---------------------------------------------------------------------------
+
+
+class _FrameProducer(threading.Thread):
+    """Capture frames into a bounded queue so inference never stalls capture."""
+
+    def __init__(self, cap: cv2.VideoCapture, frame_queue: "queue.Queue") -> None:
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.frame_queue = frame_queue
+        self.running = True
+        self.dropped_frames = 0
+
+    def run(self) -> None:
+        while self.running:
+            # Decode only frames that have queue space waiting: when the
+            # pipeline is saturated, grab() dequeues the driver buffer
+            # without paying for the colour conversion of a frame that
+            # would be evicted anyway.
+            if self.frame_queue.full():
+                if not self.cap.grab():
+                    break
+                self.dropped_frames += 1
+                continue
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            if not frame.flags["C_CONTIGUOUS"]:
+                # OpenCV's C API copies non-contiguous frames on every call;
+                # normalise the layout once here instead.
+                frame = np.ascontiguousarray(frame)
+            # Never block behind a slow inference stage: evict the oldest
+            # queued frame instead, so decisions always see recent frames
+            # and the latency between world state and motor command stays
+            # bounded by the queue depth.
+            try:
+                self.frame_queue.put_nowait(frame)
+            except queue.Full:
+                try:
+                    self.frame_queue.get_nowait()
+                    self.dropped_frames += 1
+                except queue.Empty:
+                    pass
+                self.frame_queue.put_nowait(frame)
+        # ``None`` signals the downstream stages to shut down.
+        self.frame_queue.put(None)
+
+
+#: Sentinel pushed instead of a detection result when the camera is judged
+#: obstructed; downstream turns it into a safe stop without running YOLO.
+CAMERA_OBSTRUCTED = object()
+
+
+class _BatchInferencer(threading.Thread):
+    """Run YOLO on small frame batches pulled from the capture queue.
+
+    Batching up to four frames per ``predict`` call amortises the model's
+    per-invocation overhead and keeps the accelerator busy while the main
+    thread handles decisions and drawing.  Frames dark enough to indicate a
+    covered lens skip the model entirely: detections on them are garbage
+    anyway, so the batch only carries frames worth inferring on.
+    """
+
+    BATCH_SIZE = 4
+    #: Mean brightness below which a frame is treated as a covered lens.
+    COVERED_BRIGHTNESS = 5.0
+
+    def __init__(self, model: YOLO, frame_queue: "queue.Queue", results_queue: "queue.Queue") -> None:
+        super().__init__(daemon=True)
+        self.model = model
+        self.frame_queue = frame_queue
+        self.results_queue = results_queue
+        # FP16 halves both the device copies and the maths when a CUDA
+        # device (e.g. a Jetson) is present; on CPU ultralytics ignores it.
+        self.half = torch.cuda.is_available()
+
+    def run(self) -> None:
+        while True:
+            frame = self.frame_queue.get()
+            if frame is None:
+                self.results_queue.put(None)
+                return
+
+            batch = [frame]
+            finished = False
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    next_frame = self.frame_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_frame is None:
+                    finished = True
+                    break
+                batch.append(next_frame)
+
+            # Cheap subsampled probe per frame; obstructed frames are load
+            # shed before they reach the model.
+            probes = [float(item[::20, ::20].mean()) for item in batch]
+            visible = [
+                item
+                for item, probe in zip(batch, probes)
+                if probe >= self.COVERED_BRIGHTNESS
+            ]
+            results = iter(
+                self.model.predict(
+                    visible, imgsz=320, conf=0.35, iou=0.5, half=self.half, verbose=False
+                )
+                if visible
+                else ()
+            )
+            for item_frame, probe in zip(batch, probes):
+                if probe < self.COVERED_BRIGHTNESS:
+                    self.results_queue.put((item_frame, CAMERA_OBSTRUCTED))
+                else:
+                    self.results_queue.put((item_frame, next(results)))
+
+            if finished:
+                self.results_queue.put(None)
+                return
+
+
+class _OverlayWriter(threading.Thread):
+    """Annotate frames and drive the preview window off the decision thread.
+
+    Drawing and ``imshow`` are pure presentation; pushing them onto their
+    own consumer stage means a slow window manager can only ever drop
+    preview frames, never delay a motor command.
+    """
+
+    WINDOW_TITLE = "Enhanced Traffic Navigation System"
+
+    def __init__(self, system: "ObjectPerceptionSystem", display_queue: "queue.Queue") -> None:
+        super().__init__(daemon=True)
+        self.system = system
+        self.display_queue = display_queue
+        self.quit_requested = False
+
+    def run(self) -> None:
+        while True:
+            item = self.display_queue.get()
+            if item is None:
+                break
+            frame, context = item
+            annotated = self.system.draw_overlay(frame, context)
+            cv2.imshow(self.WINDOW_TITLE, annotated)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                self.quit_requested = True
+        cv2.destroyAllWindows()
+
+
 # ---------------------------------------------------------------------------
 # Top level perception system
 # ---------------------------------------------------------------------------
@@ -373,6 +775,11 @@ class FrameContext:
 class ObjectPerceptionSystem:
     """High level orchestrator that ties all helper classes together."""
 
+    #: Row bands the HUD occupies: the text block at the top of the frame
+    #: and the status bar along the bottom.
+    HUD_STRIP_HEIGHT = 240
+    STATUS_BAR_HEIGHT = 40
+
     def __init__(self, model_path: str = "yolov8n.pt") -> None:
         self.logger = logger
         self.model_path = model_path
@@ -382,9 +789,47 @@ class ObjectPerceptionSystem:
         self.speed_estimator = SpeedEstimator()
         self.environment_detector = EnvironmentDetector()
         self.controller = CarController()
-
-    def _load_model(self, model_path: str) -> YOLO:
+        # Scratch record array reused every frame by process_frame.
+        self._objects_scratch = np.empty(64, dtype=TRACK_DTYPE)
+        # Integer-indexed lookup tables so the hot loop never touches the
+        # name strings: known widths by COCO class id, and the traffic
+        # light id for equality tests instead of string compares.
+        names = self.model.names
+        self._widths_by_id = np.full(max(names) + 1, 1.5, dtype=np.float32)
+        for class_id, name in names.items():
+            width = self.distance_estimator.known_widths.get(name)
+            if width is not None:
+                self._widths_by_id[class_id] = width
+        self._traffic_light_id = self.traffic_detector.traffic_light_class_id
+        # Cached HUD layer: the text block and status bar are rasterised
+        # once per state change and composited per frame, because
+        # cv2.putText is a vector rasteriser and far too slow to re-run
+        # seven-plus times every frame.
+        self._hud_key: Optional[tuple] = None
+        self._hud_layer: Optional[np.ndarray] = None
+        self._hud_mask: Optional[np.ndarray] = None
+
+    def _load_model(self, model_path: str):
+        # Prefer the INT8 ONNXRuntime session when the runtime is present;
+        # PyTorch FP32 inference stays as the portable fallback.
+        if YoloOrtRunner.is_available():
+            try:
+                model = YoloOrtRunner(model_path)
+                self.logger.info("YOLOv8 served via INT8 ONNXRuntime: %s", model_path)
+                return model
+            except Exception as exc:
+                self.logger.warning("ONNXRuntime backend failed (%s); using PyTorch", exc)
         model = YOLO(model_path)
+        try:
+            # Folding BatchNorm into the conv weights removes a layer per
+            # block from every forward pass.
+            model.fuse()
+        except (AttributeError, TypeError):
+            pass
+        # One throwaway inference builds the persistent predictor and its
+        # preprocessing buffers, so the first real frame does not pay the
+        # set-up cost mid-drive.
+        model.predict(np.zeros((480, 640, 3), np.uint8), imgsz=320, verbose=False)
         self.logger.info("YOLOv8 model loaded: %s", model_path)
         return model
 
@@ -392,41 +837,65 @@ class ObjectPerceptionSystem:
     # Frame processing
     # ------------------------------------------------------------------
 
-    def process_frame(self, frame: np.ndarray, frame_count: int) -> FrameContext:
+    def process_frame(self, frame: np.ndarray, frame_count: int, results=None) -> FrameContext:
         frame_height, frame_width = frame.shape[:2]
 
         environment = self.environment_detector.detect(frame)
         self.controller.update_environment(environment)
 
-        results = self.model(frame)[0]
+        if results is CAMERA_OBSTRUCTED:
+            # Detection was load-shed upstream; drop to a safe stop rather
+            # than act on perception that cannot be trusted.
+            return self._obstructed_context(environment)
+
+        if results is None:
+            # 320 px input is plenty at prototype driving speeds and costs
+            # roughly a quarter of the default 640 px FLOPs; ultralytics
+            # scales the returned boxes back to frame pixels, so the
+            # distance calibration is untouched.
+            results = self.model(frame, imgsz=320, conf=0.35, iou=0.5, verbose=False)[0]
         traffic_lights = self.traffic_detector.detect(frame, results)
 
-        closest_distance = float("inf")
-        closest_type = "none"
-        current_objects: Dict[str, Dict[str, object]] = {}
+        # Pull every box attribute out of the result in one bulk conversion
+        # and vectorise the width/distance maths; Python only loops to build
+        # the per-object dict the speed estimator consumes.
+        xyxy = _as_array(results.boxes.xyxy).astype(np.int32).reshape(-1, 4)
+        cls_ids = _as_array(results.boxes.cls).astype(np.int32).reshape(-1)
+
+        widths = xyxy[:, 2] - xyxy[:, 0]
+        distances = _batch_distances(
+            widths,
+            np.clip(cls_ids, 0, len(self._widths_by_id) - 1),
+            self._widths_by_id,
+            float(self.distance_estimator.focal_length),
+        )
 
-        for idx, box in enumerate(results.boxes):
-            x1, y1, x2, y2 = map(int, box.xyxy[0])
-            cls_id = int(box.cls[0])
-            label = str(self.model.names[cls_id])
-            if label == "traffic light":
-                continue
+        keep = cls_ids != self._traffic_light_id
+
+        # Fill the preallocated structure-of-arrays scratch buffer with
+        # whole-column assignments; no per-object dicts are created.
+        kept = xyxy[keep]
+        count = len(kept)
+        if count > len(self._objects_scratch):
+            self._objects_scratch = np.empty(count * 2, dtype=TRACK_DTYPE)
+        objects = self._objects_scratch[:count]
+        objects["x1"], objects["y1"] = kept[:, 0], kept[:, 1]
+        objects["x2"], objects["y2"] = kept[:, 2], kept[:, 3]
+        objects["cx"] = (kept[:, 0] + kept[:, 2]) // 2
+        objects["cy"] = (kept[:, 1] + kept[:, 3]) // 2
+        objects["cls"] = cls_ids[keep]
+        objects["w"] = kept[:, 2] - kept[:, 0]
+
+        candidates = np.where(keep & (distances > 0.5), distances, np.inf)
+        if candidates.size and np.isfinite(candidates).any():
+            best = int(candidates.argmin())
+            closest_distance = float(candidates[best])
+            closest_type = str(self.model.names[int(cls_ids[best])])
+        else:
+            closest_distance = float("inf")
+            closest_type = "none"
 
-            obj_id = f"{label}_{idx}_{frame_count}"
-            current_objects[obj_id] = {
-                "center_x": (x1 + x2) // 2,
-                "center_y": (y1 + y2) // 2,
-                "label": label,
-                "bbox": (x1, y1, x2, y2),
-                "width": x2 - x1,
-            }
-
-            distance = self.distance_estimator.calculate(x2 - x1, label)
-            if distance < closest_distance and distance > 0.5:
-                closest_distance = distance
-                closest_type = label
-
-        object_speeds = self.speed_estimator.estimate(current_objects, frame_width)
+        object_speeds = self.speed_estimator.estimate(objects, frame_width)
         action, speed, reason = self.controller.decide_action(
             traffic_lights, closest_distance, closest_type, object_speeds
         )
@@ -446,39 +915,114 @@ class ObjectPerceptionSystem:
             vehicle_speed=vehicle_speed,
         )
 
+    def _obstructed_context(self, environment: Dict[str, object]) -> FrameContext:
+        """Safe-stop context used while the camera is covered or frozen."""
+
+        previous_action = self.controller.last_action
+        executed_action, executed_speed = self.controller.execute(
+            "STOP", 0, "Camera obstructed"
+        )
+        vehicle_speed = self.speed_estimator.update_vehicle_speed(
+            executed_action, previous_action
+        )
+        return FrameContext(
+            environment=environment,
+            traffic_lights=[],
+            closest_distance=float("inf"),
+            closest_type="none",
+            object_speeds={},
+            action=executed_action,
+            action_speed=executed_speed,
+            reason="Camera obstructed",
+            vehicle_speed=vehicle_speed,
+        )
+
     # ------------------------------------------------------------------
     # Visualisation helpers
     # ------------------------------------------------------------------
 
     def draw_overlay(self, frame: np.ndarray, context: FrameContext) -> np.ndarray:
         frame_height, frame_width = frame.shape[:2]
+
+        # Short lists make a manual scan cheaper than max() with a lambda
+        # keying into each dict.
+        main_light = None
+        best_confidence = -1.0
+        for light in context.traffic_lights:
+            confidence = light["confidence"]
+            if confidence > best_confidence:
+                main_light = light
+                best_confidence = confidence
+
+        hud_key = (
+            frame_width,
+            frame_height,
+            context.environment["time_of_day"],
+            context.environment["weather"],
+            None if main_light is None else str(main_light["color"]),
+            context.vehicle_speed,
+            context.closest_type,
+            context.closest_distance,
+            tuple(context.object_speeds.values()),
+            context.action,
+            context.action_speed,
+            context.reason,
+        )
+        if hud_key != self._hud_key:
+            self._render_hud(frame_width, frame_height, context, main_light)
+            self._hud_key = hud_key
+        # The HUD only occupies the top strip and the bottom status bar, so
+        # the composite touches those row bands instead of the whole frame.
+        top = slice(0, min(self.HUD_STRIP_HEIGHT, frame_height))
+        cv2.copyTo(self._hud_layer[top], self._hud_mask[top], frame[top])
+        bottom = slice(max(0, frame_height - self.STATUS_BAR_HEIGHT), frame_height)
+        cv2.copyTo(self._hud_layer[bottom], self._hud_mask[bottom], frame[bottom])
+
+        if main_light is not None:
+            # The detection box moves every frame, so it stays a direct draw.
+            x1, y1, x2, y2 = main_light["bbox"]
+            cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 255, 0), 3)
+            cv2.putText(frame, "TRAFFIC LIGHT", (x1, y1 - 10), _HUD_FONT, 0.5, (255, 255, 0), 2)
+
+        return frame
+
+    def _render_hud(
+        self,
+        frame_width: int,
+        frame_height: int,
+        context: FrameContext,
+        main_light: Optional[Dict[str, object]],
+    ) -> None:
+        """Rasterise the textual HUD into the cached layer and mask."""
+
+        if self._hud_layer is None or self._hud_layer.shape[:2] != (frame_height, frame_width):
+            self._hud_layer = np.zeros((frame_height, frame_width, 3), np.uint8)
+            self._hud_mask = np.zeros((frame_height, frame_width), np.uint8)
+        layer = self._hud_layer
+        layer[:] = 0
+
         info_y = 30
         line_height = 25
 
         env_info = f"Time: {context.environment['time_of_day']} | Weather: {context.environment['weather']}"
-        cv2.putText(frame, env_info, (10, info_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        cv2.putText(layer, env_info, (10, info_y), _HUD_FONT, 0.5, (255, 255, 255), 1)
 
-        if context.traffic_lights:
-            main_light = max(context.traffic_lights, key=lambda x: x["confidence"])
-            light_colour = {"RED": (0, 0, 255), "YELLOW": (0, 255, 255), "GREEN": (0, 255, 0)}
+        if main_light is not None:
             cv2.putText(
-                frame,
+                layer,
                 f"TRAFFIC LIGHT: {main_light['color']} 🚦",
                 (10, info_y + line_height),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                _HUD_FONT,
                 0.6,
-                light_colour.get(str(main_light["color"]), (255, 255, 255)),
+                _LIGHT_COLOURS.get(str(main_light["color"]), (255, 255, 255)),
                 2,
             )
-            x1, y1, x2, y2 = main_light["bbox"]
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 255, 0), 3)
-            cv2.putText(frame, "TRAFFIC LIGHT", (x1, y1 - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
 
         cv2.putText(
-            frame,
+            layer,
             f"Vehicle Speed: {context.vehicle_speed} km/h",
             (10, info_y + line_height * 2),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            _HUD_FONT,
             0.5,
             (255, 255, 255),
             1,
@@ -488,10 +1032,10 @@ class ObjectPerceptionSystem:
         if context.closest_distance != float("inf"):
             closest_text += f" ({context.closest_distance}m)"
         cv2.putText(
-            frame,
+            layer,
             closest_text,
             (10, info_y + line_height * 3),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            _HUD_FONT,
             0.5,
             (255, 255, 255),
             1,
@@ -499,91 +1043,146 @@ class ObjectPerceptionSystem:
 
         for idx, speed in enumerate(context.object_speeds.values()):
             cv2.putText(
-                frame,
+                layer,
                 f"Object {idx + 1}: {speed} km/h",
                 (10, info_y + line_height * (4 + idx)),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                _HUD_FONT,
                 0.4,
                 (255, 255, 255),
                 1,
             )
 
         cv2.putText(
-            frame,
+            layer,
             f"ACTION: {context.action} at {context.action_speed} km/h",
             (10, info_y + line_height * 6),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            _HUD_FONT,
             0.6,
             (255, 255, 0),
             2,
         )
         cv2.putText(
-            frame,
+            layer,
             f"Reason: {context.reason}",
             (10, info_y + line_height * 7),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            _HUD_FONT,
             0.4,
             (255, 255, 255),
             1,
         )
 
-        status_bar_height = 40
-        status_colour = {
-            "STOP": (0, 0, 255),
-            "SLOW DOWN": (0, 165, 255),
-            "FORWARD": (0, 255, 0),
-            "LEFT": (255, 165, 0),
-            "RIGHT": (255, 165, 0),
-        }.get(context.action, (100, 100, 100))
-        cv2.rectangle(frame, (0, frame_height - status_bar_height), (frame_width, frame_height), status_colour, -1)
+        status_bar_height = self.STATUS_BAR_HEIGHT
+        status_colour = _STATUS_COLOURS.get(context.action, (100, 100, 100))
+        cv2.rectangle(layer, (0, frame_height - status_bar_height), (frame_width, frame_height), status_colour, -1)
         status_text = (
             f"{context.action} | {context.vehicle_speed} km/h | "
             f"{context.environment['time_of_day']} | {context.environment['weather']}"
         )
         cv2.putText(
-            frame,
+            layer,
             status_text,
             (10, frame_height - 10),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            _HUD_FONT,
             0.6,
             (255, 255, 255),
             2,
         )
 
-        return frame
+        # Any painted pixel belongs to the HUD; the mask drives the blit.
+        cv2.cvtColor(layer, cv2.COLOR_BGR2GRAY, dst=self._hud_mask)
+        cv2.threshold(self._hud_mask, 0, 255, cv2.THRESH_BINARY, dst=self._hud_mask)
 
     # ------------------------------------------------------------------
     # Execution helper
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _open_camera(camera_index: int) -> cv2.VideoCapture:
+        """Open the webcam tuned for low-latency capture.
+
+        The V4L2 backend with an MJPG pixel format moves compressed frames
+        over the USB bus (roughly a tenth of the raw bandwidth, which is
+        the bottleneck on a USB-2 Pi) and OpenCV decodes them with
+        libjpeg-turbo on arrival.  The driver-side buffer is kept at a
+        single frame so staleness is governed purely by our own bounded
+        queues.
+        """
+
+        cap = cv2.VideoCapture(camera_index, cv2.CAP_V4L2)
+        if not cap.isOpened():
+            # Non-Linux hosts (or exotic drivers) fall back to the default
+            # backend with the same buffering policy.
+            cap = cv2.VideoCapture(camera_index)
+        else:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            cap.set(cv2.CAP_PROP_FPS, 30)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
+
     def run(self, camera_index: int = 0) -> None:
-        cap = cv2.VideoCapture(camera_index)
+        cap = self._open_camera(camera_index)
         frame_count = 0
 
         print("🚗 Starting Enhanced Traffic Navigation System")
         print("=" * 50)
 
+        # Capture, inference, decision-making and presentation run as a
+        # pipeline of bounded stages: a producer thread keeps the frame
+        # queue topped up, the inferencer batches YOLO, this thread makes
+        # decisions, and the overlay writer draws and displays.  Throughput
+        # is then set by the slowest stage rather than their sum.
+        frame_queue: "queue.Queue" = queue.Queue(maxsize=4)
+        results_queue: "queue.Queue" = queue.Queue(maxsize=8)
+        display_queue: "queue.Queue" = queue.Queue(maxsize=2)
+        producer = _FrameProducer(cap, frame_queue)
+        inferencer = _BatchInferencer(self.model, frame_queue, results_queue)
+        writer = _OverlayWriter(self, display_queue)
+        producer.start()
+        inferencer.start()
+        writer.start()
+
+        # The per-frame path reuses preallocated buffers, so automatic
+        # collection mostly finds nothing; disabling it removes GC pauses
+        # from the real-time loop and a periodic manual sweep reclaims
+        # whatever cyclic garbage does accumulate.
+        gc.disable()
+        last_gc = time.monotonic()
+
         try:
             while True:
-                ret, frame = cap.read()
-                if not ret:
+                item = results_queue.get()
+                if item is None:
                     break
+                frame, results = item
+
+                now = time.monotonic()
+                if now - last_gc > 10.0:
+                    gc.collect()
+                    last_gc = now
 
                 frame_count += 1
-                context = self.process_frame(frame, frame_count)
-                annotated_frame = self.draw_overlay(frame, context)
-                cv2.imshow("Enhanced Traffic Navigation System", annotated_frame)
+                context = self.process_frame(frame, frame_count, results=results)
+
+                # Preview frames are droppable; decisions are not.
+                try:
+                    display_queue.put_nowait((frame, context))
+                except queue.Full:
+                    pass
 
-                if cv2.waitKey(1) & 0xFF == ord("q"):
+                if writer.quit_requested:
                     print("\n🛑 Exiting simulation...")
                     break
-
-                time.sleep(0.1)
         except KeyboardInterrupt:
             print("\n🛑 Simulation interrupted by user")
         finally:
+            gc.enable()
+            producer.running = False
+            display_queue.put(None)
+            if producer.dropped_frames:
+                logger.info("Dropped %s stale frames to bound latency", producer.dropped_frames)
             cap.release()
-            cv2.destroyAllWindows()
             print("📹 Camera released")
             print("📝 Action log saved to 'car_actions.log'")
             print("🚗 Simulation ended")
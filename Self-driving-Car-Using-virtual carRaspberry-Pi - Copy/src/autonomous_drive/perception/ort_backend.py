@@ -0,0 +1,172 @@
+"""Optional ONNXRuntime backend for the YOLOv8 obstacle detector.
+
+``YOLO("yolov8n.pt")`` runs FP32 PyTorch inference every frame, which is the
+dominant cost on a Raspberry Pi class CPU.  This module exports the model to
+INT8 ONNX once and serves it through an ``onnxruntime.InferenceSession``,
+which uses the NEON/VNNI dot-product paths for roughly 2-4x the throughput at
+half the memory bandwidth.
+
+ONNXRuntime stays an optional dependency, mirroring how the TensorRT backend
+is handled for lane navigation: when the import fails
+:meth:`YoloOrtRunner.is_available` returns ``False`` and the caller keeps
+using the PyTorch model.  Results are wrapped so the familiar
+``results.boxes`` access patterns keep working.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from ultralytics import YOLO
+
+from autonomous_drive.utils.logger import get_logger
+
+try:  # pragma: no cover - optional accelerated runtime
+    import onnxruntime as ort
+except ImportError:  # pragma: no cover - running without ONNXRuntime
+    ort = None
+
+logger = get_logger(__name__)
+
+
+class OrtBoxes:
+    """Minimal stand-in for ``ultralytics`` boxes backed by NumPy arrays."""
+
+    def __init__(self, xyxy: np.ndarray, cls: np.ndarray, conf: np.ndarray) -> None:
+        self.xyxy = xyxy
+        self.cls = cls
+        self.conf = conf
+
+    def __len__(self) -> int:
+        return len(self.cls)
+
+    def __iter__(self):
+        for index in range(len(self.cls)):
+            yield OrtBoxes(
+                self.xyxy[index : index + 1],
+                self.cls[index : index + 1],
+                self.conf[index : index + 1],
+            )
+
+
+class OrtResult:
+    """Single-frame result exposing ``.boxes`` like an ultralytics result."""
+
+    def __init__(self, boxes: OrtBoxes) -> None:
+        self.boxes = boxes
+
+
+class YoloOrtRunner:
+    """Serve an INT8 ONNX export of YOLOv8 through ONNXRuntime."""
+
+    def __init__(
+        self,
+        model_path: str = "yolov8n.pt",
+        imgsz: int = 320,
+        conf_threshold: float = 0.25,
+        nms_threshold: float = 0.45,
+    ) -> None:
+        if not self.is_available():
+            raise RuntimeError("onnxruntime is required for YoloOrtRunner")
+
+        self.imgsz = imgsz
+        self.conf_threshold = conf_threshold
+        self.nms_threshold = nms_threshold
+        self.names: Dict[int, str] = dict(YOLO(model_path).names)
+
+        onnx_path = Path(model_path).with_suffix(".onnx")
+        if not onnx_path.exists():
+            logger.info("Exporting %s to INT8 ONNX (one-off)...", model_path)
+            YOLO(model_path).export(format="onnx", imgsz=imgsz, int8=True, dynamic=False)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        available = ort.get_available_providers()
+        providers = [
+            provider
+            for provider in ("CUDAExecutionProvider", "CPUExecutionProvider")
+            if provider in available
+        ]
+        self.session = ort.InferenceSession(
+            str(onnx_path), sess_options=options, providers=providers
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        logger.info("ONNXRuntime session ready (%s)", ", ".join(providers))
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return ``True`` when ONNXRuntime is importable."""
+
+        return ort is not None
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+
+    def predict(self, source, **_ignored) -> List[OrtResult]:
+        """Run inference on one frame or a list of frames.
+
+        Extra keyword arguments (``imgsz``, ``verbose``...) are accepted and
+        ignored so the runner is call-compatible with ``YOLO.predict``.
+        """
+
+        frames = source if isinstance(source, (list, tuple)) else [source]
+        return [self._predict_single(frame) for frame in frames]
+
+    def __call__(self, source, **kwargs) -> List[OrtResult]:
+        return self.predict(source, **kwargs)
+
+    def _predict_single(self, frame: np.ndarray) -> OrtResult:
+        height, width = frame.shape[:2]
+        resized = cv2.resize(frame, (self.imgsz, self.imgsz))
+        blob = resized[:, :, ::-1].transpose(2, 0, 1).astype(np.float32) / 255.0
+
+        outputs = self.session.run(None, {self.input_name: blob[np.newaxis]})
+        # YOLOv8 head: (1, 4 + num_classes, anchors) -> (anchors, 4 + classes)
+        predictions = outputs[0][0].T
+
+        class_scores = predictions[:, 4:]
+        class_ids = class_scores.argmax(axis=1)
+        confidences = class_scores[np.arange(len(class_ids)), class_ids]
+        keep = confidences > self.conf_threshold
+        if not np.any(keep):
+            empty = np.empty((0,), np.float32)
+            return OrtResult(OrtBoxes(np.empty((0, 4), np.float32), empty, empty))
+
+        boxes_xywh = predictions[keep, :4]
+        class_ids = class_ids[keep]
+        confidences = confidences[keep]
+
+        half_wh = boxes_xywh[:, 2:4] / 2.0
+        xyxy = np.concatenate(
+            (boxes_xywh[:, :2] - half_wh, boxes_xywh[:, :2] + half_wh), axis=1
+        )
+
+        indices = cv2.dnn.NMSBoxes(
+            np.concatenate((xyxy[:, :2], boxes_xywh[:, 2:4]), axis=1).tolist(),
+            confidences.tolist(),
+            self.conf_threshold,
+            self.nms_threshold,
+        )
+        if len(indices) == 0:
+            empty = np.empty((0,), np.float32)
+            return OrtResult(OrtBoxes(np.empty((0, 4), np.float32), empty, empty))
+
+        indices = np.asarray(indices).reshape(-1)
+        scale = np.array(
+            [width / self.imgsz, height / self.imgsz] * 2, np.float32
+        )
+        return OrtResult(
+            OrtBoxes(
+                xyxy[indices] * scale,
+                class_ids[indices].astype(np.float32),
+                confidences[indices].astype(np.float32),
+            )
+        )
+
+
+__all__ = ["YoloOrtRunner", "OrtResult", "OrtBoxes"]
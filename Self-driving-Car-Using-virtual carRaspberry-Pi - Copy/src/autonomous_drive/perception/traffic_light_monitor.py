@@ -12,6 +12,7 @@ from typing import Tuple
 
 import cv2
 import numpy as np
+import time
 
 from autonomous_drive.control.motor_controller import MotorController
 from autonomous_drive.utils.logger import get_logger
@@ -40,6 +41,38 @@ except (ImportError, RuntimeError):  # pragma: no cover - running off-device
     GPIO = MockGPIO()
 
 
+try:  # pragma: no cover - numba is an optional accelerator
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - running without numba
+    njit = prange = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _classify_hsv(hsv, out):  # pragma: no cover - compiled path
+        """Pack red (bit 0) and green (bit 1) verdicts into ``out``.
+
+        One parallel pass over the HSV rows replaces the table gather and
+        its index temporaries; the hue bounds are the original 0-180
+        thresholds rescaled to the full 0-255 hue range.
+        """
+        for y in prange(hsv.shape[0]):
+            for x in range(hsv.shape[1]):
+                h = hsv[y, x, 0]
+                s = hsv[y, x, 1]
+                v = hsv[y, x, 2]
+                packed = 0
+                if h >= 193 and s >= 87 and v >= 111:
+                    packed = 1
+                elif 94 <= h <= 122 and s >= 122 and v >= 129:
+                    packed = 2
+                out[y, x] = packed
+
+else:
+    _classify_hsv = None
+
+
 logger = get_logger(__name__)
 
 
@@ -59,9 +92,39 @@ class TrafficLightConfig:
 class TrafficLightMonitor:
     """Detect red/green lights and proxy basic driving commands."""
 
+    #: Seconds between processed frames.  The light logic only needs ~10 Hz;
+    #: frames arriving in between are skipped without being decoded.
+    PROCESS_INTERVAL = 0.1
+
+    #: Colour extraction runs on a 4x-downscaled ROI; boxes are scaled back
+    #: up for drawing and the contour area floor shrinks by the same 16x.
+    MASK_SCALE = 4
+    MIN_CONTOUR_AREA = 20
+
     def __init__(self, config: TrafficLightConfig | None = None) -> None:
         self.config = config or TrafficLightConfig()
         self.motor_controller = MotorController()
+        # Packed HSV classification: the numba kernel writes straight into
+        # a reused scratch buffer; without numba, a precomputed table keeps
+        # the thresholding to a single gather.  Bit 0 marks red, bit 1
+        # green, and both paths share the same bounds.
+        self._packed_scratch: np.ndarray | None = None
+        # Annotations found this frame; drawn after the motor command has
+        # been issued so presentation never delays the decision.
+        self._pending_annotations: list = []
+        # A steady light would otherwise emit an identical log line every
+        # frame; one line per colour per second is plenty.
+        self._last_log = {"RED": 0.0, "GREEN": 0.0}
+        if _classify_hsv is not None:
+            # Compile now so the first real frame does not pay the JIT cost.
+            _classify_hsv(np.zeros((2, 2, 3), np.uint8), np.empty((2, 2), np.uint8))
+            self._hsv_lut = None
+        else:
+            lut = np.zeros((256, 256, 256), np.uint8)
+            lut[np.ix_(np.arange(193, 256), np.arange(87, 256), np.arange(111, 256))] |= 1
+            lut[np.ix_(np.arange(94, 123), np.arange(122, 256), np.arange(129, 256))] |= 2
+            self._hsv_lut = lut
+        self._dilate_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
         self._setup_gpio()
 
     # ------------------------------------------------------------------
@@ -97,42 +160,55 @@ class TrafficLightMonitor:
     # Computer vision helpers
     # ------------------------------------------------------------------
 
-    def _extract_regions(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-
-        red_lower = np.array([136, 87, 111], np.uint8)
-        red_upper = np.array([180, 255, 255], np.uint8)
-        green_lower = np.array([66, 122, 129], np.uint8)
-        green_upper = np.array([86, 255, 255], np.uint8)
-
-        red_mask = cv2.inRange(hsv, red_lower, red_upper)
-        green_mask = cv2.inRange(hsv, green_lower, green_upper)
-
-        kernel = np.ones((5, 5), "uint8")
-        red_mask = cv2.dilate(red_mask, kernel)
-        green_mask = cv2.dilate(green_mask, kernel)
-
-        red_result = cv2.bitwise_and(frame, frame, mask=red_mask)
-        green_result = cv2.bitwise_and(frame, frame, mask=green_mask)
-        return red_mask, green_mask, red_result, green_result
+    def _extract_regions(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # HSV_FULL spreads hue over the whole byte instead of 0-180,
+        # doubling hue resolution for free; the bounds above are rescaled
+        # to match.
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV_FULL)
+
+        if _classify_hsv is not None:
+            if self._packed_scratch is None or self._packed_scratch.shape != hsv.shape[:2]:
+                self._packed_scratch = np.empty(hsv.shape[:2], np.uint8)
+            packed = self._packed_scratch
+            _classify_hsv(hsv, packed)
+        else:
+            packed = self._hsv_lut[hsv[..., 0], hsv[..., 1], hsv[..., 2]]
+
+        # One two-channel dilation covers both colours; dilate processes
+        # the channels independently, so the result matches dilating the
+        # masks one at a time at half the passes over the ROI.
+        both = cv2.merge(((packed & 1) * np.uint8(255), (packed & 2) * np.uint8(127)))
+        both = cv2.dilate(both, self._dilate_kernel)
+        red_mask, green_mask = cv2.split(both)
+        return red_mask, green_mask
 
     def _handle_light(self, mask: np.ndarray, colour: str) -> bool:
-        contours, _ = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area <= 300:
+        # Most frames carry no candidate pixels at all, and one SIMD
+        # popcount over the small mask is an order of magnitude cheaper
+        # than labelling an empty image.
+        if cv2.countNonZero(mask) <= self.MIN_CONTOUR_AREA:
+            return False
+
+        # Labelling returns area and bounding box for every blob in one C
+        # pass; the contour walk and its per-blob Python calls are gone.
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        for label in range(1, count):
+            if stats[label, cv2.CC_STAT_AREA] <= self.MIN_CONTOUR_AREA:
                 continue
 
-            x, y, w, h = cv2.boundingRect(contour)
+            x, y, w, h = (int(value) * self.MASK_SCALE for value in stats[label, :4])
             colour_bgr = (0, 0, 255) if colour == "RED" else (0, 255, 0)
-            label = "RED" if colour == "RED" else "GREEN"
-            logger.info("%s light detected", label)
-            cv2.rectangle(self.current_frame, (x, y), (x + w, y + h), colour_bgr, 2)
-            cv2.putText(self.current_frame, f"{label} light", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, colour_bgr, 2)
+            # Act on the light first; the rectangle and caption are queued
+            # and drawn once both colours have been decided.
             if colour == "RED":
                 self.stop()
             else:
                 self.forward()
+            now = time.monotonic()
+            if now - self._last_log[colour] > 1.0:
+                logger.info("%s light detected", colour)
+                self._last_log[colour] = now
+            self._pending_annotations.append((x, y, w, h, colour_bgr, f"{colour} light"))
             return True
         return False
 
@@ -142,22 +218,47 @@ class TrafficLightMonitor:
 
     def run(self, camera_index: int = 0) -> None:
         cap = cv2.VideoCapture(camera_index)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         self.forward()
 
         try:
+            deadline = time.monotonic()
             while cap.isOpened():
-                ret, frame = cap.read()
+                # grab() only advances the driver to the newest frame;
+                # retrieve() decodes a single frame per processed tick, so
+                # the frames skipped between ticks never pay the YUV->BGR
+                # conversion the old read()+waitKey(100) loop did.
+                if not cap.grab():
+                    break
+                now = time.monotonic()
+                if now < deadline:
+                    continue
+                deadline = now + self.PROCESS_INTERVAL
+
+                ret, frame = cap.retrieve()
                 if not ret:
                     break
 
                 self.current_frame = frame[30:2000, 500:700]
-                red_mask, green_mask, _, _ = self._extract_regions(self.current_frame)
+                small = cv2.resize(
+                    self.current_frame,
+                    None,
+                    fx=1.0 / self.MASK_SCALE,
+                    fy=1.0 / self.MASK_SCALE,
+                    interpolation=cv2.INTER_AREA,
+                )
+                red_mask, green_mask = self._extract_regions(small)
 
                 red_seen = self._handle_light(red_mask, "RED")
                 green_seen = self._handle_light(green_mask, "GREEN")
 
+                for x, y, w, h, colour_bgr, caption in self._pending_annotations:
+                    cv2.rectangle(self.current_frame, (x, y), (x + w, y + h), colour_bgr, 2)
+                    cv2.putText(self.current_frame, caption, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, colour_bgr, 2)
+                self._pending_annotations.clear()
+
                 cv2.imshow("Traffic Light Monitor", self.current_frame)
-                if cv2.waitKey(100) & 0xFF == ord("q"):
+                if cv2.waitKey(1) & 0xFF == ord("q"):
                     break
 
                 if red_seen:
@@ -0,0 +1,106 @@
+"""Optional TensorRT inference backend for YOLOv4-tiny on Jetson-class targets.
+
+On devices with TensorRT the OpenCV DNN path leaves roughly 2x performance on
+the table because box decoding and NMS still run outside the engine.  This
+module wraps a prebuilt engine whose graph ends in the ``EfficientNMS_TRT``
+plugin, so a single enqueue returns already-NMSed boxes, scores and class ids.
+
+The engine is produced offline (``yolov4-tiny.weights`` -> ONNX -> ``trtexec``
+with EfficientNMS appended) and simply dropped next to the FP32 weights as
+``yolov4-tiny.engine``.  TensorRT and PyCUDA stay optional dependencies: when
+either is missing :meth:`TRTYoloBackend.is_available` returns ``False`` and the
+caller keeps using the OpenCV DNN pipeline.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+from autonomous_drive.utils.logger import get_logger
+
+try:  # pragma: no cover - Jetson-only dependencies
+    import pycuda.autoinit  # noqa: F401 - initialises the CUDA context
+    import pycuda.driver as cuda
+    import tensorrt as trt
+except ImportError:  # pragma: no cover - running without TensorRT
+    cuda = None
+    trt = None
+
+logger = get_logger(__name__)
+
+
+class TRTYoloBackend:
+    """Run a serialized YOLO engine with fused EfficientNMS outputs."""
+
+    INPUT_SIZE = 320
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return ``True`` when TensorRT and PyCUDA are importable."""
+
+        return trt is not None and cuda is not None
+
+    def __init__(self, engine_path: Path) -> None:
+        if not self.is_available():
+            raise RuntimeError("TensorRT and PyCUDA are required for TRTYoloBackend")
+
+        self.engine_path = Path(engine_path)
+        runtime = trt.Runtime(trt.Logger(trt.Logger.WARNING))
+        with self.engine_path.open("rb") as handle:
+            self.engine = runtime.deserialize_cuda_engine(handle.read())
+        self.context = self.engine.create_execution_context()
+        self.stream = cuda.Stream()
+
+        # Pinned host buffers plus matching device allocations for every
+        # binding, so each frame is one async upload, one enqueue and four
+        # async downloads.
+        self._host = {}
+        self._device = {}
+        self._bindings = []
+        for index in range(self.engine.num_bindings):
+            name = self.engine.get_binding_name(index)
+            dtype = trt.nptype(self.engine.get_binding_dtype(index))
+            shape = tuple(self.engine.get_binding_shape(index))
+            host_buffer = cuda.pagelocked_empty(int(abs(np.prod(shape))), dtype)
+            device_buffer = cuda.mem_alloc(host_buffer.nbytes)
+            self._host[name] = host_buffer.reshape(shape)
+            self._device[name] = device_buffer
+            self._bindings.append(int(device_buffer))
+
+        logger.info("TensorRT engine loaded from %s", self.engine_path.name)
+
+    def infer(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run fused inference and return class ids, scores and xyxy boxes.
+
+        Boxes are returned in source-frame pixel coordinates.
+        """
+
+        import cv2
+
+        height, width = image.shape[:2]
+        resized = cv2.resize(image, (self.INPUT_SIZE, self.INPUT_SIZE))
+        blob = resized[:, :, ::-1].transpose(2, 0, 1).astype(np.float32) / 255.0
+
+        input_name = self.engine.get_binding_name(0)
+        np.copyto(self._host[input_name], blob[np.newaxis])
+        cuda.memcpy_htod_async(self._device[input_name], self._host[input_name], self.stream)
+        self.context.execute_async_v2(self._bindings, self.stream.handle)
+        for name in ("num_dets", "det_boxes", "det_scores", "det_classes"):
+            cuda.memcpy_dtoh_async(self._host[name], self._device[name], self.stream)
+        self.stream.synchronize()
+
+        count = int(self._host["num_dets"].reshape(-1)[0])
+        boxes = self._host["det_boxes"].reshape(-1, 4)[:count].astype(np.float32)
+        scores = self._host["det_scores"].reshape(-1)[:count].astype(np.float32)
+        classes = self._host["det_classes"].reshape(-1)[:count].astype(np.int64)
+
+        scale = np.array(
+            [width / self.INPUT_SIZE, height / self.INPUT_SIZE] * 2, np.float32
+        )
+        return classes, scores, boxes * scale
+
+
+__all__ = ["TRTYoloBackend"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass
 from typing import Callable
@@ -14,7 +15,7 @@ try:  # pragma: no cover - mocked during tests
     import RPi.GPIO as GPIO  # type: ignore
 except (ImportError, RuntimeError):  # pragma: no cover - running off-device
     class MockGPIO:
-        BCM = OUT = IN = LOW = HIGH = None
+        BCM = OUT = IN = LOW = HIGH = BOTH = None
 
         def setwarnings(self, *_, **__):
             pass
@@ -31,6 +32,9 @@ except (ImportError, RuntimeError):  # pragma: no cover - running off-device
         def input(self, *_, **__):
             return 0
 
+        def add_event_detect(self, *_, **__):
+            pass
+
         def cleanup(self, *_, **__):
             pass
 
@@ -62,6 +66,13 @@ class ParkingAssistant:
     def __init__(self, motor_controller: MotorController | None = None, config: ParkingConfig | None = None) -> None:
         self.motor_controller = motor_controller or MotorController()
         self.gpio_config = config or ParkingConfig.from_gpio(GPIOConfig())
+        # Echo edge timestamps recorded by the GPIO event callback; the
+        # event flags a completed rise/fall pair to measure_distance.
+        self._echo_rise_ns = 0
+        self._echo_fall_ns = 0
+        self._echo_done = threading.Event()
+        self._edge_detection = False
+        self._last_trigger_ns = 0
         self._setup_gpio()
 
     def _setup_gpio(self) -> None:
@@ -71,29 +82,67 @@ class ParkingAssistant:
         GPIO.setup(self.gpio_config.ultrasonic_echo, GPIO.IN)
         GPIO.setup(self.gpio_config.indicator_pin, GPIO.OUT)
         GPIO.output(self.gpio_config.indicator_pin, 1)
+
+        # Let the kernel timestamp the echo edges rather than spinning on
+        # GPIO.input at interpreter speed: near-zero CPU while waiting and
+        # microsecond-grade pulse timing.
+        try:
+            GPIO.add_event_detect(
+                self.gpio_config.ultrasonic_echo, GPIO.BOTH, callback=self._on_echo_edge
+            )
+            self._edge_detection = True
+        except Exception as exc:  # pragma: no cover - hardware errors
+            logger.warning("Echo edge detection unavailable (%s); polling instead", exc)
+
         logger.info("🅿️ Parking assistant initialised")
 
+    def _on_echo_edge(self, _channel) -> None:
+        timestamp = time.perf_counter_ns()
+        if GPIO.input(self.gpio_config.ultrasonic_echo):
+            self._echo_rise_ns = timestamp
+        else:
+            self._echo_fall_ns = timestamp
+            self._echo_done.set()
+
     def measure_distance(self) -> float:
         """Return the current ultrasonic sensor distance in centimetres."""
 
         try:
+            self._echo_done.clear()
             GPIO.output(self.gpio_config.ultrasonic_trigger, False)
-            time.sleep(0.1)
+            # The HC-SR04 only needs ~60 us of quiet before the trigger;
+            # the legacy 100 ms settle capped sampling below 10 Hz.  Any
+            # time since the previous measurement counts towards it.
+            settled_ns = time.perf_counter_ns() - self._last_trigger_ns
+            if settled_ns < 60_000:
+                time.sleep((60_000 - settled_ns) * 1e-9)
             GPIO.output(self.gpio_config.ultrasonic_trigger, True)
-            time.sleep(0.00001)
+            # sleep() cannot resolve 10 us, so the trigger pulse is held
+            # high with a short busy wait instead.
+            pulse_ns = time.perf_counter_ns()
+            while time.perf_counter_ns() - pulse_ns < 10_000:
+                pass
             GPIO.output(self.gpio_config.ultrasonic_trigger, False)
+            self._last_trigger_ns = time.perf_counter_ns()
+
+            if self._edge_detection:
+                # Sleep until the falling edge lands (max range on an
+                # HC-SR04 is well under 40 ms round trip).
+                if not self._echo_done.wait(timeout=0.04):
+                    return 0.0
+                pulse_duration = (self._echo_fall_ns - self._echo_rise_ns) * 1e-9
+                return round(pulse_duration * 17150, 2)
 
+            # Polling fallback for stacks without event support.
             while GPIO.input(self.gpio_config.ultrasonic_echo) == 0:
-                GPIO.output(self.gpio_config.indicator_pin, False)
-            pulse_start = time.time()
+                pass
+            pulse_start = time.perf_counter()
 
             while GPIO.input(self.gpio_config.ultrasonic_echo) == 1:
-                GPIO.output(self.gpio_config.indicator_pin, False)
-            pulse_end = time.time()
+                pass
+            pulse_end = time.perf_counter()
 
-            pulse_duration = pulse_end - pulse_start
-            distance = round(pulse_duration * 17150, 2)
-            return distance
+            return round((pulse_end - pulse_start) * 17150, 2)
         except Exception as exc:  # pragma: no cover - hardware errors
             logger.error("Distance measurement failed: %s", exc, exc_info=True)
             return 0.0
@@ -138,9 +187,11 @@ class ParkingAssistant:
         self._execute_for_duration(self.motor_controller.backward, duration)
 
     def _execute_for_duration(self, action: Callable[[], None], duration: float) -> None:
-        start = time.time()
-        while time.time() <= start + duration:
-            action()
+        # The motor pins latch, so one command followed by a sleep holds
+        # the manoeuvre; the old loop re-issued the same GPIO writes for
+        # the whole duration and pinned a core doing it.
+        action()
+        time.sleep(duration)
         self.motor_controller.stop()
 
 
@@ -3,15 +3,51 @@
 from __future__ import annotations
 
 import json
+import os
+import queue
 import smtplib
 import ssl
 import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Dict
+from email.message import EmailMessage
+from typing import Dict, Optional
+
+
+# Alert body prepared once at import; building the email then becomes one
+# format call over the location/status fields instead of re-parsing a long
+# f-string with a dozen attribute lookups on every incident.
+_ALERT_TEMPLATE = """
+EMERGENCY ALERT - VEHICLE ACCIDENT DETECTED
+
+🚗 VEHICLE STATUS:
+• Location: {address}
+• Coordinates: {latitude:.6f}, {longitude:.6f}
+• Speed at impact: {speed:.1f} km/h
+• Time: {timestamp}
+
+📊 VEHICLE CONDITION:
+• Battery Level: {battery_level:.0f}%
+• Motor Temperature: {motor_temperature:.1f}°C
+• Camera Status: {camera_status}
+• Obstacles Detected: {obstacles_detected}
+• Front Distance: {front_distance:.1f}m
+
+🆘 IMMEDIATE ACTION REQUIRED:
+1. Check driver status immediately
+2. Contact emergency services if needed
+3. Dispatch assistance to the location
+4. Verify vehicle safety systems
+
+📍 LOCATION MAP:
+https://maps.google.com/?q={latitude},{longitude}
+
+This is an automated emergency alert from the vehicle's safety system.
+Please respond immediately.
+
+⚠️ URGENT ATTENTION REQUIRED ⚠️
+"""
 
 
 @dataclass
@@ -34,30 +70,52 @@ class EmergencyServices:
         self.acceleration_threshold = 8.0
         self.impact_threshold = 15.0
         self.rollover_threshold = 6.0
+        # Squared thresholds let detect_accident compare squared magnitudes
+        # directly and skip the sqrt on every sensor tick.
+        self._acceleration_threshold_sq = self.acceleration_threshold ** 2
+        self._impact_threshold_sq = self.impact_threshold ** 2
+        self._rollover_threshold_sq = self.rollover_threshold ** 2
         self.accident_detected = False
         self.last_emergency_call = 0.0
         self.cooldown_period = 300.0
 
+        # Emergency emails go through one long-lived worker thread that keeps
+        # an authenticated SMTP connection open.  Queueing is bounded so a
+        # cascade of aftershock alerts cannot spawn a connection storm.
+        self._mail_queue: "queue.Queue[EmailMessage]" = queue.Queue(maxsize=16)
+        self._mail_worker: Optional[threading.Thread] = None
+        self._smtp_connection: Optional[smtplib.SMTP] = None
+        # Incident log fd, opened lazily with O_APPEND so each record is
+        # one atomic write with no per-event open/close.
+        self._incident_fd: Optional[int] = None
+
     def detect_accident(self, sensor_data: Dict[str, Dict[str, float]]) -> bool:
         try:
             imu_data = sensor_data.get("imu", {})
             gps_data = sensor_data.get("gps", {})
 
-            acceleration_x = abs(imu_data.get("acceleration_x", 0))
-            acceleration_y = abs(imu_data.get("acceleration_y", 0))
-            acceleration_z = abs(imu_data.get("acceleration_z", 0) - 9.8)
-            total_acceleration = (acceleration_x ** 2 + acceleration_y ** 2 + acceleration_z ** 2) ** 0.5
-
-            gyro_x = abs(imu_data.get("gyro_x", 0))
-            gyro_y = abs(imu_data.get("gyro_y", 0))
-            gyro_z = abs(imu_data.get("gyro_z", 0))
-            total_rotation = (gyro_x ** 2 + gyro_y ** 2 + gyro_z ** 2) ** 0.5
+            # Compare squared magnitudes against squared thresholds; the
+            # sqrt adds nothing to a monotonic comparison and this runs on
+            # every sensor tick.
+            acceleration_x = imu_data.get("acceleration_x", 0)
+            acceleration_y = imu_data.get("acceleration_y", 0)
+            acceleration_z = imu_data.get("acceleration_z", 0) - 9.8
+            total_acceleration_sq = (
+                acceleration_x * acceleration_x
+                + acceleration_y * acceleration_y
+                + acceleration_z * acceleration_z
+            )
+
+            gyro_x = imu_data.get("gyro_x", 0)
+            gyro_y = imu_data.get("gyro_y", 0)
+            gyro_z = imu_data.get("gyro_z", 0)
+            total_rotation_sq = gyro_x * gyro_x + gyro_y * gyro_y + gyro_z * gyro_z
 
             current_speed = gps_data.get("speed", 0)
-            sudden_stop = current_speed < 5 and total_acceleration > self.acceleration_threshold
+            sudden_stop = current_speed < 5 and total_acceleration_sq > self._acceleration_threshold_sq
 
-            crash_impact = total_acceleration > self.impact_threshold
-            rollover = total_rotation > self.rollover_threshold
+            crash_impact = total_acceleration_sq > self._impact_threshold_sq
+            rollover = total_rotation_sq > self._rollover_threshold_sq
             accident = crash_impact or rollover or sudden_stop
 
             if accident and not self.accident_detected:
@@ -65,7 +123,7 @@ class EmergencyServices:
                 self.trigger_emergency_protocol(sensor_data)
                 return True
 
-            if self.accident_detected and total_acceleration < 2 and total_rotation < 1:
+            if self.accident_detected and total_acceleration_sq < 4 and total_rotation_sq < 1:
                 self.accident_detected = False
 
             return False
@@ -114,74 +172,82 @@ class EmergencyServices:
             return
 
         self.last_emergency_call = current_time
-        email_success = self._send_real_emergency_email(location, vehicle_status)
+        email_queued = self._queue_emergency_email(location, vehicle_status)
         phone_success = self._simulate_emergency_call(location)
 
-        if email_success:
-            print("✅ REAL emergency email sent successfully!")
-        else:
-            print("❌ Failed to send emergency email")
+        if not email_queued:
+            print("❌ Failed to queue emergency email")
         if phone_success:
             print("📞 Simulated emergency phone call placed")
 
-    def _send_real_emergency_email(self, location: Dict[str, float], vehicle_status: Dict[str, float]) -> bool:
-        try:
-            if (
-                self.smtp_config.sender_email == "your.email@gmail.com"
-                or self.smtp_config.sender_password == "your_app_password"
-            ):
-                print("❌ Please configure your Gmail SMTP credentials first!")
-                print("   Update sender_email and sender_password in the configuration")
-                return False
-
-            subject = "🚨 VEHICLE ACCIDENT ALERT 🚨"
-            message = f"""
-EMERGENCY ALERT - VEHICLE ACCIDENT DETECTED
-
-🚗 VEHICLE STATUS:
-• Location: {location['address']}
-• Coordinates: {location['latitude']:.6f}, {location['longitude']:.6f}
-• Speed at impact: {location['speed']:.1f} km/h
-• Time: {location['timestamp']}
-
-📊 VEHICLE CONDITION:
-• Battery Level: {vehicle_status['battery_level']:.0f}%
-• Motor Temperature: {vehicle_status['motor_temperature']:.1f}°C
-• Camera Status: {vehicle_status['camera_status']}
-• Obstacles Detected: {vehicle_status['obstacles_detected']}
-• Front Distance: {vehicle_status['front_distance']:.1f}m
-
-🆘 IMMEDIATE ACTION REQUIRED:
-1. Check driver status immediately
-2. Contact emergency services if needed
-3. Dispatch assistance to the location
-4. Verify vehicle safety systems
+    def _queue_emergency_email(self, location: Dict[str, float], vehicle_status: Dict[str, float]) -> bool:
+        """Build the alert email and hand it to the background mail worker."""
 
-📍 LOCATION MAP:
-https://maps.google.com/?q={location['latitude']},{location['longitude']}
-
-This is an automated emergency alert from the vehicle's safety system.
-Please respond immediately.
-
-⚠️ URGENT ATTENTION REQUIRED ⚠️
-"""
+        message = self._build_emergency_email(location, vehicle_status)
+        if message is None:
+            return False
 
-            msg = MIMEMultipart()
-            msg["From"] = self.smtp_config.sender_email
-            msg["To"] = self.emergency_contacts["email"]
-            msg["Subject"] = subject
-            msg.attach(MIMEText(message, "plain"))
-
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_config.server, self.smtp_config.port) as server:
-                server.starttls(context=context)
-                server.login(self.smtp_config.sender_email, self.smtp_config.sender_password)
-                server.send_message(msg)
-
-            return True
-        except Exception as exc:  # pragma: no cover - network failures
-            print(f"Email sending failed: {exc}")
+        self._ensure_mail_worker()
+        try:
+            self._mail_queue.put_nowait(message)
+        except queue.Full:
+            print("⚠️ Emergency mail queue full – dropping alert")
             return False
+        return True
+
+    def _ensure_mail_worker(self) -> None:
+        if self._mail_worker is None or not self._mail_worker.is_alive():
+            self._mail_worker = threading.Thread(target=self._mail_loop, daemon=True)
+            self._mail_worker.start()
+
+    def _connect_smtp(self) -> smtplib.SMTP:
+        context = ssl.create_default_context()
+        server = smtplib.SMTP(self.smtp_config.server, self.smtp_config.port)
+        server.starttls(context=context)
+        server.login(self.smtp_config.sender_email, self.smtp_config.sender_password)
+        return server
+
+    def _mail_loop(self) -> None:
+        """Deliver queued alerts over one persistent SMTP connection.
+
+        The TLS handshake and login are paid once; a NOOP probe detects stale
+        connections and triggers a reconnect before sending.
+        """
+
+        while True:
+            message = self._mail_queue.get()
+            try:
+                if self._smtp_connection is not None:
+                    try:
+                        self._smtp_connection.noop()
+                    except (smtplib.SMTPServerDisconnected, smtplib.SMTPException):
+                        self._smtp_connection = None
+                if self._smtp_connection is None:
+                    self._smtp_connection = self._connect_smtp()
+
+                self._smtp_connection.send_message(message)
+                print("✅ REAL emergency email sent successfully!")
+            except Exception as exc:  # pragma: no cover - network failures
+                print(f"Email sending failed: {exc}")
+                self._smtp_connection = None
+            finally:
+                self._mail_queue.task_done()
+
+    def _build_emergency_email(self, location: Dict[str, float], vehicle_status: Dict[str, float]) -> Optional[EmailMessage]:
+        if (
+            self.smtp_config.sender_email == "your.email@gmail.com"
+            or self.smtp_config.sender_password == "your_app_password"
+        ):
+            print("❌ Please configure your Gmail SMTP credentials first!")
+            print("   Update sender_email and sender_password in the configuration")
+            return None
+
+        msg = EmailMessage()
+        msg["From"] = self.smtp_config.sender_email
+        msg["To"] = self.emergency_contacts["email"]
+        msg["Subject"] = "🚨 VEHICLE ACCIDENT ALERT 🚨"
+        msg.set_content(_ALERT_TEMPLATE.format_map({**location, **vehicle_status}))
+        return msg
 
     def _simulate_emergency_call(self, location: Dict[str, float]) -> bool:
         print("📞 Simulating emergency phone call...")
@@ -198,8 +264,19 @@ Please respond immediately.
             "vehicle_status": vehicle_status,
         }
         try:
-            with open("emergency_incidents.json", "a", encoding="utf-8") as handle:
-                handle.write(json.dumps(incident) + "\n")
+            first_incident = self._incident_fd is None
+            if first_incident:
+                self._incident_fd = os.open(
+                    "emergency_incidents.json",
+                    os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                    0o644,
+                )
+            payload = json.dumps(incident, separators=(",", ":")) + "\n"
+            os.write(self._incident_fd, payload.encode("utf-8"))
+            if first_incident:
+                # Make sure at least the first record of a session survives
+                # a hard power loss; repeats within a burst stay buffered.
+                os.fsync(self._incident_fd)
         except Exception as exc:  # pragma: no cover
             print(f"Failed to log emergency incident: {exc}")
 
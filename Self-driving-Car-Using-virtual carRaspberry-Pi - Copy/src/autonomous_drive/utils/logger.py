@@ -5,8 +5,14 @@ Provides consistent logging across all modules
 
 import logging
 import os
+import queue
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# The log file name is fixed for the lifetime of the process, so it is
+# computed once at import instead of per get_logger call.
+_LOG_FILE = f'logs/vehicle_{datetime.now().strftime("%Y%m%d")}.log'
 
 
 class VehicleLogger:
@@ -16,6 +22,8 @@ class VehicleLogger:
     """
     
     _loggers = {}
+    _listeners = {}
+    _lock = threading.Lock()
     
     @staticmethod
     def get_logger(name: str, log_level: str = 'INFO') -> logging.Logger:
@@ -29,28 +37,45 @@ class VehicleLogger:
         Returns:
             logging.Logger: Configured logger instance
         """
-        if name in VehicleLogger._loggers:
-            return VehicleLogger._loggers[name]
+        # Fast path without the lock for already-configured loggers.
+        existing = VehicleLogger._loggers.get(name)
+        if existing is not None:
+            return existing
         
+        with VehicleLogger._lock:
+            # Re-check under the lock: another thread may have configured
+            # this logger between the lookup above and acquiring the lock,
+            # and attaching twice would duplicate every record on disk.
+            existing = VehicleLogger._loggers.get(name)
+            if existing is not None:
+                return existing
+            return VehicleLogger._configure_logger(name, log_level)
+    
+    @staticmethod
+    def _configure_logger(name: str, log_level: str) -> logging.Logger:
+        level = getattr(logging, log_level)
         logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, log_level))
+        logger.setLevel(level)
+        # Records are fully handled here; letting them propagate would
+        # re-traverse the root logger's handlers per message.
+        logger.propagate = False
         
         # Create logs directory if it doesn't exist
         if not os.path.exists('logs'):
             os.makedirs('logs')
         
         # File handler with rotation
-        log_file = f'logs/vehicle_{datetime.now().strftime("%Y%m%d")}.log'
         file_handler = RotatingFileHandler(
-            log_file,
+            _LOG_FILE,
             maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            delay=True  # don't open the file until the first record
         )
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, log_level))
+        console_handler.setLevel(level)
         
         # Formatter
         formatter = logging.Formatter(
@@ -60,10 +85,17 @@ class VehicleLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
+        # Hand records off through a queue: emit() on the caller's thread
+        # is a single put, and the rotating-file and console I/O run on
+        # the listener's own thread instead of the real-time loops.
         if not logger.handlers:
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+            record_queue = queue.Queue(-1)
+            listener = QueueListener(
+                record_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            listener.start()
+            logger.addHandler(QueueHandler(record_queue))
+            VehicleLogger._listeners[name] = listener
         
         VehicleLogger._loggers[name] = logger
         return logger
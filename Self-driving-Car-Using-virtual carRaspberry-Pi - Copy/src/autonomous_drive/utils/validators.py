@@ -3,213 +3,300 @@ Input Validation Module
 Provides validation functions for common input types
 """
 
-from typing import List, Optional, Union
+import re
 
-from autonomous_drive.utils.logger import get_logger
+from typing import List, Optional, Union
 
-logger = get_logger(__name__)
+# Compiled once at import; a single anchored match beats two substring
+# scans and also rejects strings like "a.b" or "@." the old check passed.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class ValidationError(Exception):
-    """Custom exception for validation errors."""
-    pass
+    """Custom exception for validation errors.
+
+    Accepts either a ready message or a %-format string followed by its
+    arguments.  Formatting is deferred to :meth:`__str__`, so a raise
+    that is caught and discarded never pays for building the message.
+    """
+
+    # No per-instance state beyond Exception.args.  BaseException still
+    # supplies a (lazily created) __dict__, but the empty __slots__ keeps
+    # this subclass from adding storage of its own.
+    __slots__ = ()
+
+    def __str__(self):
+        args = self.args
+        if len(args) > 1:
+            return args[0] % args[1:]
+        return super().__str__()
+
+
+def _raise_range(name, value, lower, upper):
+    """Cold path: raise the range error away from the validators' fast path."""
+    raise ValidationError("%s %s out of range [%s, %s]", name, value, lower, upper)
+
+
+def _raise_length(kind, length, bound, word):
+    """Cold path: raise the length error away from the validators' fast path."""
+    raise ValidationError("%s length %s %s %s", kind, length, word, bound)
+
+
+# The validators live at module level so hot callers can import them
+# directly and skip the staticmethod descriptor binding that every
+# ``Validator.validate_*`` attribute access pays; the class below rebinds
+# them for backwards compatibility.
+
+def validate_speed(speed: Union[int, float], min_speed: int = 0, max_speed: int = 100) -> None:
+    """
+    Validate speed value.
+
+    Args:
+        speed (Union[int, float]): Speed value to validate
+        min_speed (int): Minimum allowed speed
+        max_speed (int): Maximum allowed speed
+
+    Raises:
+        ValidationError: If speed is invalid
+    """
+    # Comparison first: with zero-cost exception handling the try adds
+    # nothing when the value is numeric, which is the steady state on a
+    # working vehicle, and non-numeric values surface as TypeError.
+    try:
+        in_range = min_speed <= speed <= max_speed
+    except TypeError:
+        raise ValidationError("Speed must be numeric, got %s", type(speed))
+
+    if not in_range:
+        _raise_range("Speed", speed, min_speed, max_speed)
+
+
+def validate_distance(distance: Union[int, float], min_dist: float = 0.0) -> None:
+    """
+    Validate distance value.
+
+    Args:
+        distance (Union[int, float]): Distance value to validate
+        min_dist (float): Minimum allowed distance
+
+    Raises:
+        ValidationError: If distance is invalid
+    """
+    try:
+        too_close = distance < min_dist
+    except TypeError:
+        raise ValidationError("Distance must be numeric, got %s", type(distance))
+
+    if too_close:
+        raise ValidationError("Distance %s cannot be less than %s", distance, min_dist)
+
+
+def validate_gpio_pin(pin: int) -> None:
+    """
+    Validate GPIO pin number.
+
+    Args:
+        pin (int): GPIO pin number
+
+    Raises:
+        ValidationError: If pin is invalid
+    """
+    if not isinstance(pin, int):
+        raise ValidationError("GPIO pin must be integer, got %s", type(pin))
+
+    if pin < 0 or pin > 27:  # Raspberry Pi GPIO range
+        raise ValidationError("GPIO pin %s out of valid range [0, 27]", pin)
+
+
+def validate_confidence(confidence: float) -> None:
+    """
+    Validate confidence score (0.0 to 1.0).
+
+    Args:
+        confidence (float): Confidence score
+
+    Raises:
+        ValidationError: If confidence is invalid
+    """
+    try:
+        in_range = 0.0 <= confidence <= 1.0
+    except TypeError:
+        raise ValidationError("Confidence must be numeric, got %s", type(confidence))
+
+    if not in_range:
+        _raise_range("Confidence", confidence, 0.0, 1.0)
+
+
+def validate_string(value: str, min_length: int = 1, max_length: Optional[int] = None) -> None:
+    """
+    Validate string value.
+
+    Args:
+        value (str): String to validate
+        min_length (int): Minimum string length
+        max_length (Optional[int]): Maximum string length
+
+    Raises:
+        ValidationError: If string is invalid
+    """
+    if not isinstance(value, str):
+        raise ValidationError("Value must be string, got %s", type(value))
+
+    length = len(value)
+    if length < min_length:
+        _raise_length("String", length, min_length, "less than minimum")
+
+    # "is not None" so an explicit max_length of 0 still applies.
+    if max_length is not None and length > max_length:
+        _raise_length("String", length, max_length, "exceeds maximum")
+
+
+def validate_list(value: List, min_length: int = 0, max_length: Optional[int] = None) -> None:
+    """
+    Validate list value.
+
+    Args:
+        value (List): List to validate
+        min_length (int): Minimum list length
+        max_length (Optional[int]): Maximum list length
+
+    Raises:
+        ValidationError: If list is invalid
+    """
+    if not isinstance(value, list):
+        raise ValidationError("Value must be list, got %s", type(value))
+
+    length = len(value)
+    if length < min_length:
+        _raise_length("List", length, min_length, "less than minimum")
+
+    if max_length is not None and length > max_length:
+        _raise_length("List", length, max_length, "exceeds maximum")
+
+
+def validate_dict(value: dict, required_keys: Optional[List[str]] = None) -> None:
+    """
+    Validate dictionary value.
+
+    Args:
+        value (dict): Dictionary to validate
+        required_keys (Optional[List[str]]): Required keys in dictionary
+
+    Raises:
+        ValidationError: If dictionary is invalid
+    """
+    if not isinstance(value, dict):
+        raise ValidationError("Value must be dict, got %s", type(value))
+
+    if required_keys:
+        # One dict probe per key; the all-present common case allocates
+        # nothing, unlike the old two-set difference.
+        missing_keys = [key for key in required_keys if key not in value]
+        if missing_keys:
+            raise ValidationError("Missing required keys: %s", set(missing_keys))
+
+
+def validate_email(email: str) -> None:
+    """
+    Validate email address format.
+
+    Args:
+        email (str): Email address to validate
+
+    Raises:
+        ValidationError: If email is invalid
+    """
+    if not isinstance(email, str):
+        raise ValidationError("Email must be string, got %s", type(email))
+
+    if _EMAIL_RE.match(email) is None:
+        raise ValidationError("Invalid email format: %s", email)
+
+
+def validate_speed_array(speeds, min_speed: int = 0, max_speed: int = 100) -> None:
+    """
+    Validate a batch of speed samples in one vectorised pass.
+
+    Checking a telemetry buffer element by element costs one Python call
+    per sample; NumPy's comparison kernels do the whole buffer in a
+    single C loop.
+
+    Args:
+        speeds: Array-like of speed samples
+        min_speed (int): Minimum allowed speed
+        max_speed (int): Maximum allowed speed
+
+    Raises:
+        ValidationError: Reporting the first out-of-range sample
+    """
+    # Imported here so the scalar validators keep the module free of the
+    # NumPy import cost for callers that never batch.
+    import numpy as np
+
+    speeds = np.asarray(speeds)
+    bad = (speeds < min_speed) | (speeds > max_speed)
+    if bad.any():
+        index = int(bad.argmax())
+        raise ValidationError(
+            "Speed %s at index %s out of range [%s, %s]",
+            speeds[index], index, min_speed, max_speed,
+        )
+
+
+# Specialised validators generated once per distinct bound pair; the
+# cache means repeated configuration reuses the compiled code object.
+_range_validator_cache: dict = {}
+
+
+def make_range_validator(name: str, lower: Union[int, float], upper: Union[int, float]):
+    """
+    Build a validator specialised for fixed bounds.
+
+    The bounds of a deployed system are effectively constants, so the
+    generated function bakes them in as literals: the comparison loads
+    constants instead of reading default arguments on every call.
+
+    Args:
+        name (str): Quantity name used in error messages, e.g. "Speed"
+        lower (Union[int, float]): Inclusive lower bound
+        upper (Union[int, float]): Inclusive upper bound
+
+    Returns:
+        Callable[[Union[int, float]], None]: Validator raising
+        ValidationError when the value is out of range
+    """
+    key = (name, lower, upper)
+    validator = _range_validator_cache.get(key)
+    if validator is None:
+        source = (
+            f"def validate_{name.lower()}(value):\n"
+            f"    try:\n"
+            f"        in_range = {lower!r} <= value <= {upper!r}\n"
+            f"    except TypeError:\n"
+            f"        raise ValidationError('{name} must be numeric, got %s', type(value))\n"
+            f"    if not in_range:\n"
+            f"        _raise_range('{name}', value, {lower!r}, {upper!r})\n"
+        )
+        namespace = {"ValidationError": ValidationError, "_raise_range": _raise_range}
+        exec(source, namespace)
+        validator = _range_validator_cache[key] = namespace[f"validate_{name.lower()}"]
+    return validator
 
 
 class Validator:
     """
     Input validation utility class.
-    Provides methods to validate various input types.
-    """
-    
-    @staticmethod
-    def validate_speed(speed: Union[int, float], min_speed: int = 0, max_speed: int = 100) -> bool:
-        """
-        Validate speed value.
-        
-        Args:
-            speed (Union[int, float]): Speed value to validate
-            min_speed (int): Minimum allowed speed
-            max_speed (int): Maximum allowed speed
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If speed is invalid
-        """
-        if not isinstance(speed, (int, float)):
-            raise ValidationError(f"Speed must be numeric, got {type(speed)}")
-        
-        if speed < min_speed or speed > max_speed:
-            raise ValidationError(f"Speed {speed} out of range [{min_speed}, {max_speed}]")
-        
-        return True
-    
-    @staticmethod
-    def validate_distance(distance: Union[int, float], min_dist: float = 0.0) -> bool:
-        """
-        Validate distance value.
-        
-        Args:
-            distance (Union[int, float]): Distance value to validate
-            min_dist (float): Minimum allowed distance
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If distance is invalid
-        """
-        if not isinstance(distance, (int, float)):
-            raise ValidationError(f"Distance must be numeric, got {type(distance)}")
-        
-        if distance < min_dist:
-            raise ValidationError(f"Distance {distance} cannot be less than {min_dist}")
-        
-        return True
-    
-    @staticmethod
-    def validate_gpio_pin(pin: int) -> bool:
-        """
-        Validate GPIO pin number.
-        
-        Args:
-            pin (int): GPIO pin number
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If pin is invalid
-        """
-        if not isinstance(pin, int):
-            raise ValidationError(f"GPIO pin must be integer, got {type(pin)}")
-        
-        if pin < 0 or pin > 27:  # Raspberry Pi GPIO range
-            raise ValidationError(f"GPIO pin {pin} out of valid range [0, 27]")
-        
-        return True
-    
-    @staticmethod
-    def validate_confidence(confidence: float) -> bool:
-        """
-        Validate confidence score (0.0 to 1.0).
-        
-        Args:
-            confidence (float): Confidence score
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If confidence is invalid
-        """
-        if not isinstance(confidence, (int, float)):
-            raise ValidationError(f"Confidence must be numeric, got {type(confidence)}")
-        
-        if confidence < 0.0 or confidence > 1.0:
-            raise ValidationError(f"Confidence {confidence} out of range [0.0, 1.0]")
-        
-        return True
-    
-    @staticmethod
-    def validate_string(value: str, min_length: int = 1, max_length: Optional[int] = None) -> bool:
-        """
-        Validate string value.
-        
-        Args:
-            value (str): String to validate
-            min_length (int): Minimum string length
-            max_length (Optional[int]): Maximum string length
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If string is invalid
-        """
-        if not isinstance(value, str):
-            raise ValidationError(f"Value must be string, got {type(value)}")
-        
-        if len(value) < min_length:
-            raise ValidationError(f"String length {len(value)} less than minimum {min_length}")
-        
-        if max_length and len(value) > max_length:
-            raise ValidationError(f"String length {len(value)} exceeds maximum {max_length}")
-        
-        return True
-    
-    @staticmethod
-    def validate_list(value: List, min_length: int = 0, max_length: Optional[int] = None) -> bool:
-        """
-        Validate list value.
-        
-        Args:
-            value (List): List to validate
-            min_length (int): Minimum list length
-            max_length (Optional[int]): Maximum list length
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If list is invalid
-        """
-        if not isinstance(value, list):
-            raise ValidationError(f"Value must be list, got {type(value)}")
-        
-        if len(value) < min_length:
-            raise ValidationError(f"List length {len(value)} less than minimum {min_length}")
-        
-        if max_length and len(value) > max_length:
-            raise ValidationError(f"List length {len(value)} exceeds maximum {max_length}")
-        
-        return True
-    
-    @staticmethod
-    def validate_dict(value: dict, required_keys: Optional[List[str]] = None) -> bool:
-        """
-        Validate dictionary value.
-        
-        Args:
-            value (dict): Dictionary to validate
-            required_keys (Optional[List[str]]): Required keys in dictionary
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If dictionary is invalid
-        """
-        if not isinstance(value, dict):
-            raise ValidationError(f"Value must be dict, got {type(value)}")
-        
-        if required_keys:
-            missing_keys = set(required_keys) - set(value.keys())
-            if missing_keys:
-                raise ValidationError(f"Missing required keys: {missing_keys}")
-        
-        return True
-    
-    @staticmethod
-    def validate_email(email: str) -> bool:
-        """
-        Validate email address format.
-        
-        Args:
-            email (str): Email address to validate
-        
-        Returns:
-            bool: True if valid, raises ValidationError otherwise
-        
-        Raises:
-            ValidationError: If email is invalid
-        """
-        if not isinstance(email, str):
-            raise ValidationError(f"Email must be string, got {type(email)}")
-        
-        if '@' not in email or '.' not in email:
-            raise ValidationError(f"Invalid email format: {email}")
-        
-        return True
+    Kept as a thin namespace over the module-level validators.
+    """
+
+    __slots__ = ()
 
+    validate_speed = staticmethod(validate_speed)
+    validate_distance = staticmethod(validate_distance)
+    validate_gpio_pin = staticmethod(validate_gpio_pin)
+    validate_confidence = staticmethod(validate_confidence)
+    validate_string = staticmethod(validate_string)
+    validate_list = staticmethod(validate_list)
+    validate_dict = staticmethod(validate_dict)
+    validate_email = staticmethod(validate_email)
+    validate_speed_array = staticmethod(validate_speed_array)
@@ -1,5 +1,15 @@
 """Legacy utilities namespace forwarding to ``autonomous_drive.utils``."""
 
+import sys
+
 from autonomous_drive.utils import VehicleLogger, ValidationError, Validator, get_logger
+from autonomous_drive.utils import logger, validators
+
+# Alias the legacy submodule names to the real modules instead of keeping
+# shim files: ``utils.validators`` and ``autonomous_drive.utils.validators``
+# are now the same module object, so importing the legacy path loads and
+# caches nothing extra.
+sys.modules[__name__ + ".logger"] = logger
+sys.modules[__name__ + ".validators"] = validators
 
 __all__ = ["VehicleLogger", "ValidationError", "Validator", "get_logger"]
@@ -1,5 +0,0 @@
-"""Legacy shim forwarding to :mod:`autonomous_drive.utils.validators`."""
-
-from autonomous_drive.utils.validators import ValidationError, Validator
-
-__all__ = ["ValidationError", "Validator"]